@@ -31,27 +31,32 @@ def build_file_tree(path: Path, base_path: Path = None) -> List[Dict[str, Any]]:
     
     tree = []
     try:
-        for item in sorted(path.iterdir()):
+        # os.scandir: DirEntry가 타입/stat 정보를 캐시하므로 항목당 stat 호출 1회
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        
+        for entry in entries:
             # 숨김 파일과 특정 디렉토리 제외
-            if item.name.startswith('.') or item.name in ['__pycache__', 'node_modules', '.git']:
+            if entry.name.startswith('.') or entry.name in ['__pycache__', 'node_modules', '.git']:
                 continue
             
+            is_dir = entry.is_dir()
             node = {
-                'name': item.name,
-                'path': str(item.relative_to(base_path)),
-                'type': 'directory' if item.is_dir() else 'file'
+                'name': entry.name,
+                'path': os.path.relpath(entry.path, base_path),
+                'type': 'directory' if is_dir else 'file'
             }
             
-            if item.is_file():
-                # 파일 크기와 수정 시간 추가
-                stat = item.stat()
-                node['size'] = stat.st_size
-                node['modified'] = stat.st_mtime
-            elif item.is_dir():
+            if is_dir:
                 # 재귀적으로 하위 디렉토리 탐색
-                children = build_file_tree(item, base_path)
+                children = build_file_tree(Path(entry.path), base_path)
                 if children:  # 빈 디렉토리는 children 추가 안함
                     node['children'] = children
+            elif entry.is_file():
+                # 파일 크기와 수정 시간 추가
+                stat = entry.stat()
+                node['size'] = stat.st_size
+                node['modified'] = stat.st_mtime
             
             tree.append(node)
     except PermissionError:
@@ -1,15 +1,27 @@
 # backend/execution.py - Backend 디렉토리에서 실행하도록 수정된 전체 코드
 
+import ast
 import asyncio
+import contextlib
+import hashlib
 import json
+import marshal
 import os
+import signal
 import subprocess
 import sys
 import tempfile
 import requests
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 from models import Node, Section
 
+# orjson이 있으면 노드 입력/출력 직렬화에 사용, 없으면 표준 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # storage 모듈은 나중에 필요할 때 import
 # from storage import get_global_var, get_section_outputs
 
@@ -22,6 +34,66 @@ def get_section_outputs(section_name):
     """특정 섹션의 모든 출력을 가져옵니다 - 더미 구현"""
     return {}
 
+# 노드 코드 컴파일 결과 캐시 (코드 해시 -> marshal된 코드 객체)
+# 같은 코드를 입력만 바꿔 반복 실행할 때 실행 프로세스의 파싱/컴파일 단계를 생략
+CODE_CACHE_MAX_ENTRIES = 256
+_code_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+def _compile_code(code: str, name: str) -> Optional[bytes]:
+    """노드 코드를 컴파일해 marshal된 코드 객체 반환 (실패 시 None)"""
+    try:
+        # 최상위 await 허용 - 해당 코드는 실행 프로세스에서 asyncio.run으로 실행
+        code_obj = compile(code, name, "exec",
+                           flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT, dont_inherit=True)
+        return marshal.dumps(code_obj)
+    except Exception:
+        # SyntaxError뿐 아니라 RecursionError/MemoryError 등도 서버에서 삼키고,
+        # 실행 프로세스가 원본 코드를 컴파일하며 기존과 같은 방식으로 에러 보고
+        return None
+
+async def _get_compiled_code(code: str) -> Optional[bytes]:
+    """컴파일된 노드 코드 반환 (LRU 캐시, 컴파일은 이벤트 루프를 막지 않도록 스레드에서 수행)"""
+    key = hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+    compiled = _code_cache.get(key)
+    if compiled is not None:
+        _code_cache.move_to_end(key)
+        return compiled
+    
+    compiled = await asyncio.to_thread(_compile_code, code, f"<node_code:{key.hex()[:8]}>")
+    if compiled is None:
+        return None
+    
+    _code_cache[key] = compiled
+    if len(_code_cache) > CODE_CACHE_MAX_ENTRIES:
+        _code_cache.popitem(last=False)
+    return compiled
+
+def _load_output(raw: bytes) -> Dict[str, Any]:
+    """실행 결과 파일 파싱 (orjson 우선)
+
+    실행 프로세스의 표준 json 폴백은 NaN/Infinity를 쓸 수 있는데 orjson은 이를 거부하므로
+    그 경우 표준 json으로 다시 파싱한다.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+def _write_context_file(path: str, context: Dict[str, Any]):
+    """노드 실행 컨텍스트(입력, 노드 정보 등)를 JSON 파일로 저장 (스크립트에 문자열로 박아 넣지 않기 위해)"""
+    if orjson is not None:
+        try:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(context, option=orjson.OPT_NON_STR_KEYS))
+            return
+        except TypeError:
+            # orjson이 처리하지 못하는 값은 표준 json으로
+            pass
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(context, f, ensure_ascii=False)
+
 def get_project_info(project_id: str) -> Dict[str, Any]:
     """프로젝트 정보 가져오기"""
     print(f"[Execution] Getting project info for ID: {project_id}")
@@ -110,6 +182,129 @@ def get_project_root_for_node(node_id: str, section_id: str) -> str:
         pass
     return default_path
 
+# === 미리 띄워 둔 Python 인터프리터 풀 ===
+# 노드 실행마다 새 인터프리터를 띄우면 시작 + requests 등 공통 import 비용(수백 ms)이 매번 든다.
+# 인터프리터를 미리 띄워 공통 모듈을 import한 상태로 대기시키고, 실행 요청이 오면
+# 스크립트 경로와 실행 시점의 전체 환경 변수를 stdin으로 넘긴다. 각 프로세스는 한 번만 실행하고 종료되므로
+# 노드 간 격리는 기존과 동일하다.
+
+_PREWARM_BOOTSTRAP = """
+import sys, os, json, runpy, marshal
+import io, time, shutil, pathlib
+import requests
+try:
+    import orjson
+except ImportError:
+    pass
+
+line = sys.stdin.readline()
+if not line:
+    sys.exit(0)
+request = json.loads(line)
+# 인터프리터를 미리 띄운 뒤 바뀐 서버 환경 변수(API 키, 설정 등)도 반영되도록 실행 시점의 환경으로 교체
+os.environ.clear()
+os.environ.update(request['env'])
+# python script.py와 같이 스크립트 디렉토리를 sys.path[0]으로 (-c 실행 시 들어간 '' = cwd 제거)
+sys.path[0] = os.path.dirname(os.path.abspath(request['script']))
+sys.argv = [request['script']]
+runpy.run_path(request['script'], run_name='__main__')
+"""
+
+# 동시에 실행되는 노드가 많으면 환경 변수로 풀 크기를 늘릴 수 있음
+PREWARM_POOL_SIZE = int(os.getenv("ONE_AI_PREWARM_POOL_SIZE", "2"))
+
+class PrewarmedInterpreterPool:
+    """1회용 Python 인터프리터를 미리 띄워 두는 풀"""
+    
+    def __init__(self, size: int = PREWARM_POOL_SIZE):
+        self.size = size
+        self._idle: List[asyncio.subprocess.Process] = []
+        self._refill_task = None
+    
+    async def _spawn(self, cwd: str) -> asyncio.subprocess.Process:
+        env = os.environ.copy()
+        env['PYTHONIOENCODING'] = 'utf-8'
+        return await asyncio.create_subprocess_exec(
+            sys.executable, '-c', _PREWARM_BOOTSTRAP,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            # 새 세션(프로세스 그룹)으로 실행 - 타임아웃 시 사용자 코드가 띄운 자식 프로세스까지 함께 종료
+            start_new_session=True
+        )
+    
+    async def _refill(self, cwd: str):
+        # 부족한 만큼 동시에 생성 (fork/exec 및 인터프리터 시작 대기가 겹치도록)
+        missing = self.size - len(self._idle)
+        if missing <= 0:
+            return
+        spawned = await asyncio.gather(
+            *(self._spawn(cwd) for _ in range(missing)),
+            return_exceptions=True
+        )
+        for result in spawned:
+            if isinstance(result, BaseException):
+                print(f"[Execution] Failed to prewarm interpreter: {result}")
+            else:
+                self._idle.append(result)
+    
+    async def acquire(self, cwd: str) -> asyncio.subprocess.Process:
+        """대기 중인 인터프리터를 꺼내고 (없으면 새로 생성) 풀을 백그라운드에서 보충"""
+        process = None
+        while self._idle:
+            candidate = self._idle.pop()
+            if candidate.returncode is None:
+                process = candidate
+                break
+        
+        if process is None:
+            process = await self._spawn(cwd)
+        
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill(cwd))
+        
+        return process
+    
+    async def shutdown(self):
+        """대기 중인 인터프리터 정리"""
+        if self._refill_task and not self._refill_task.done():
+            self._refill_task.cancel()
+        while self._idle:
+            process = self._idle.pop()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+interpreter_pool = PrewarmedInterpreterPool()
+
+# 이 크기를 넘는 출력은 스레드에서 디코드 (이벤트 루프 지연 방지)
+DECODE_IN_THREAD_THRESHOLD = 64 * 1024
+
+async def _decode_output(data: Optional[bytes]) -> str:
+    """프로세스 출력 디코드 (큰 출력은 스레드에서 처리)"""
+    if not data:
+        return ""
+    if len(data) > DECODE_IN_THREAD_THRESHOLD:
+        return await asyncio.to_thread(data.decode, 'utf-8', 'replace')
+    return data.decode('utf-8', errors='replace')
+
+async def _terminate_process_group(process: asyncio.subprocess.Process, grace: float = 2.0):
+    """프로세스 그룹 전체 종료 (SIGTERM 후 유예 시간 안에 끝나지 않으면 SIGKILL)"""
+    if process.returncode is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), timeout=grace)
+    except asyncio.TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGKILL)
+        await process.wait()
+
 async def execute_python_code(node_id: str, code: str, context: Dict[str, Any] = None, section_id: str = None) -> Dict[str, Any]:
     """Python 코드 실행"""
     
@@ -252,6 +447,8 @@ async def execute_python_code(node_id: str, code: str, context: Dict[str, Any] =
         code_file = os.path.join(temp_dir, "node_code.py")
         output_file = os.path.join(temp_dir, "output.json")
         user_code_file = os.path.join(temp_dir, "user_code.py")
+        compiled_code_file = os.path.join(temp_dir, "user_code.bin")
+        context_file = os.path.join(temp_dir, "context.json")
         
         print(f"[Execution] Writing code to file: {code_file}")
         print(f"[Execution] Temp directory: {temp_dir}")
@@ -260,6 +457,22 @@ async def execute_python_code(node_id: str, code: str, context: Dict[str, Any] =
         with open(user_code_file, "w", encoding='utf-8') as f:
             f.write(code)
         
+        # 컴파일된 코드 객체가 있으면 함께 저장 (실행 프로세스는 이것을 우선 사용)
+        compiled_code = await _get_compiled_code(code)
+        if compiled_code is not None:
+            with open(compiled_code_file, "wb") as f:
+                f.write(compiled_code)
+        
+        # 입력 데이터와 자유 텍스트 설정도 별도 파일로 저장
+        # (대용량 입력을 스크립트 문자열에 중복 보관하지 않고, 따옴표/백슬래시 이스케이프도 필요 없음)
+        _write_context_file(context_file, {
+            "current_node": current_node_data,
+            "node_purpose": node_purpose,
+            "output_format_description": output_format_description,
+            "inputs": inputs,
+            "project_info": project_info
+        })
+        
         # wrapped_code 생성 직전 디버깅
         print(f"[Execution] project_root before wrapping: {project_root}")
         print(f"[Execution] repr(project_root): {repr(project_root)}")
@@ -274,6 +487,12 @@ import os
 import shutil
 from pathlib import Path
 
+# orjson이 있으면 결과 저장에 사용
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 # UTF-8 인코딩 설정
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -290,19 +509,20 @@ print("[WRAPPED CODE DEBUG] Exists: " + str(os.path.exists({repr(project_root)})
 
 # === 시스템 제공 변수들 ===
 
+with open(r'{context_file}', 'rb') as _context_f:
+    _context = json.loads(_context_f.read())
+
 # 1. 현재 노드 정보
-current_node_json = {repr(json.dumps(current_node_data, ensure_ascii=False))}
-current_node = json.loads(current_node_json)
+current_node = _context["current_node"]
 
 # 2. 노드 목적 (직접 접근 가능)
-node_purpose = {repr(node_purpose)}
+node_purpose = _context["node_purpose"]
 
 # 3. 출력 형식 설명 (직접 접근 가능)
-output_format_description = {repr(output_format_description)}
+output_format_description = _context["output_format_description"]
 
 # 4. 연결된 노드의 출력 (직접 접근 가능)
-inputs_json = {repr(json.dumps(inputs, ensure_ascii=False))}
-inputs = json.loads(inputs_json)
+inputs = _context["inputs"]
 
 # 5. AI 모델 설정
 model_name = {repr(model_name)}
@@ -324,7 +544,7 @@ except Exception as e:
     print("[WRAPPED CODE] Error creating project directory: " + str(e))
 
 # 8. 프로젝트 정보
-project_info = {repr(project_info)}
+project_info = _context["project_info"]
 
 # === 시스템 제공 함수들 ===
 
@@ -373,9 +593,9 @@ def call_ai_model(prompt, model=None, url=None, **kwargs):
         return {{"error": "No AI model configured", "message": "Please select an AI model in node settings"}}
     
     try:
-        print("###AI_REQUEST_START###", flush=True)
-        print("Calling AI model: " + str(model_to_use), flush=True)
-        print("Using URL: " + str(url_to_use), flush=True)
+        print("###AI_REQUEST_START###")
+        print("Calling AI model: " + str(model_to_use))
+        print("Using URL: " + str(url_to_use))
         
         # 기본 메시지 구성
         messages = kwargs.get('messages', [])
@@ -419,16 +639,16 @@ def call_ai_model(prompt, model=None, url=None, **kwargs):
         if response.status_code == 200:
             result = response.json()
             content = result['choices'][0]['message']['content']
-            print("###AI_RESPONSE_RECEIVED###", flush=True)
-            print("Response length: " + str(len(content)) + " characters", flush=True)
-            print("###AI_COMPLETE###", flush=True)
+            print("###AI_RESPONSE_RECEIVED###")
+            print("Response length: " + str(len(content)) + " characters")
+            print("###AI_COMPLETE###")
             
             # 전체 응답을 반환하려면 return_full_response=True 사용
             if kwargs.get('return_full_response', False):
                 return result
             return content
         else:
-            print("###AI_ERROR### Status code: " + str(response.status_code), flush=True)
+            print("###AI_ERROR### Status code: " + str(response.status_code))
             error_detail = ""
             try:
                 error_detail = response.json()
@@ -438,10 +658,10 @@ def call_ai_model(prompt, model=None, url=None, **kwargs):
             return {{"error": "AI model returned status " + str(response.status_code) + error_detail}}
             
     except requests.exceptions.Timeout:
-        print("###AI_ERROR### Request timeout", flush=True)
+        print("###AI_ERROR### Request timeout")
         return {{"error": "AI model request timeout"}}
     except Exception as e:
-        print("###AI_ERROR### " + str(e), flush=True)
+        print("###AI_ERROR### " + str(e))
         return {{"error": "AI model error: " + str(e)}}
 
 # === 파일 시스템 헬퍼 함수들 ===
@@ -531,33 +751,59 @@ def update_task_status(task_id, status):
     for task in current_node.get('tasks', []):
         if task['id'] == task_id:
             task['status'] = status
-            print("###TASK_UPDATE### " + str(task_id) + " -> " + str(status), flush=True)
+            print("###TASK_UPDATE### " + str(task_id) + " -> " + str(status))
             break
 
 def log_progress(message):
     \"\"\"진행 상황 로깅\"\"\"
-    print("###PROGRESS### " + str(message), flush=True)
+    print("###PROGRESS### " + str(message))
+
+def _save_result(result):
+    \"\"\"실행 결과를 output 파일로 저장 (orjson으로 처리할 수 없는 값은 표준 json)\"\"\"
+    if _orjson is not None:
+        try:
+            data = _orjson.dumps(result, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            data = None
+        if data is not None:
+            with open(r"{output_file}", "wb") as f:
+                f.write(data)
+            return
+    with open(r"{output_file}", "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False)
 
 # === 사용자 코드 실행 영역 ===
+# 출력은 프로세스 종료 시 한 번에 수집되므로 print마다 flush하지 않음 (종료 시 자동 flush)
 
 # 출력 변수 초기화 (전역 스코프에서)
 output = None
 
 try:
-    print("###EXECUTION_START###", flush=True)
-    print("Executing: " + str(current_node.get('label', 'Unknown Node')), flush=True)
-    print("Project root: " + str(project_root), flush=True)
+    print("###EXECUTION_START###")
+    print("Executing: " + str(current_node.get('label', 'Unknown Node')))
+    print("Project root: " + str(project_root))
     if project_info:
-        print("Project: " + str(project_info.get('name', 'Unknown')), flush=True)
-    
-    # 사용자 코드를 파일에서 읽어서 실행
-    with open(r'{user_code_file}', 'r', encoding='utf-8') as f:
-        user_code = f.read()
+        print("Project: " + str(project_info.get('name', 'Unknown')))
     
-    # 사용자 코드를 exec로 실행
-    exec(user_code, globals())
+    # 사용자 코드를 파일에서 읽어서 실행 (미리 컴파일된 코드 객체가 있으면 그것을 사용)
+    if os.path.exists(r'{compiled_code_file}'):
+        import marshal
+        with open(r'{compiled_code_file}', 'rb') as f:
+            user_code = marshal.load(f)
+    else:
+        import ast
+        with open(r'{user_code_file}', 'r', encoding='utf-8') as f:
+            user_code = compile(f.read(), '<string>', 'exec', flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    
+    # 사용자 코드 실행 (최상위 await가 있는 코드는 코루틴으로 컴파일되므로 asyncio.run으로 실행)
+    import inspect
+    if user_code.co_flags & inspect.CO_COROUTINE:
+        import asyncio
+        asyncio.run(eval(user_code, globals()))
+    else:
+        exec(user_code, globals())
     
-    print("###EXECUTION_COMPLETE###", flush=True)
+    print("###EXECUTION_COMPLETE###")
     
     # output 변수가 설정되었는지 확인 (전역 및 로컬 모두 체크)
     output_value = None
@@ -565,36 +811,29 @@ try:
     # 먼저 전역 변수 체크
     if 'output' in globals() and globals()['output'] is not None:
         output_value = globals()['output']
-        print("###OUTPUT_SET### Output variable detected in globals", flush=True)
+        print("###OUTPUT_SET### Output variable detected in globals")
     # 로컬 변수 체크
     elif 'output' in locals() and locals()['output'] is not None:
         output_value = locals()['output']
-        print("###OUTPUT_SET### Output variable detected in locals", flush=True)
+        print("###OUTPUT_SET### Output variable detected in locals")
     
     if output_value is not None:
         # output을 파일로 저장
-        with open(r"{output_file}", "w", encoding="utf-8") as f:
-            json.dump({{"success": True, "output": output_value}}, f, ensure_ascii=False)
-        print("###OUTPUT_SAVED### Output saved to file", flush=True)
+        _save_result({{"success": True, "output": output_value}})
+        print("###OUTPUT_SAVED### Output saved to file")
     else:
-        print("###NO_OUTPUT### No output variable set", flush=True)
-        with open(r"{output_file}", "w", encoding="utf-8") as f:
-            json.dump({{"success": True, "output": {{"message": "No output set", "status": "no_output"}}}}, f, ensure_ascii=False)
+        print("###NO_OUTPUT### No output variable set")
+        _save_result({{"success": True, "output": {{"message": "No output set", "status": "no_output"}}}})
             
 except Exception as e:
-    print("###EXECUTION_ERROR### " + str(e), flush=True)
+    print("###EXECUTION_ERROR### " + str(e))
     import traceback
     traceback.print_exc()
-    with open(r"{output_file}", "w", encoding="utf-8") as f:
-        json.dump({{"success": False, "error": str(e), "type": str(type(e).__name__)}}, f, ensure_ascii=False)
+    _save_result({{"success": False, "error": str(e), "type": str(type(e).__name__)}})
 
-# 결과 확인을 위한 최종 출력
-try:
-    with open(r"{output_file}", "r", encoding="utf-8") as f:
-        final_result = json.load(f)
-        print("###FINAL_OUTPUT###", json.dumps(final_result, ensure_ascii=False))
-except Exception as e:
-    print("###ERROR_READING_OUTPUT### " + str(e))
+# 결과는 output 파일로만 전달 (stdout에 같은 내용을 다시 출력하지 않음)
+if not os.path.exists(r"{output_file}"):
+    print("###ERROR_READING_OUTPUT### Output file was not written")
 """
         
         with open(code_file, "w", encoding='utf-8') as f:
@@ -649,33 +888,30 @@ except Exception as e:
             else:
                 # Linux/Mac에서는 asyncio subprocess 사용
                 try:
-                    process = await asyncio.create_subprocess_exec(
-                        sys.executable, code_file,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                        cwd=backend_dir,  # ★★★ temp_dir 대신 backend_dir 사용 ★★★
-                        env=env
-                    )
+                    # 미리 띄워 둔 인터프리터 사용 (cwd는 backend_dir)
+                    process = await interpreter_pool.acquire(backend_dir)
+                    # 실행 시점의 전체 환경 변수를 넘김 (기존 실행마다 os.environ.copy()하던 것과 동일)
+                    run_request = json.dumps({
+                        "script": code_file,
+                        "env": env
+                    }) + "\n"
                     
-                    print(f"[Execution] Subprocess created, waiting for completion...")
+                    print(f"[Execution] Subprocess acquired, waiting for completion...")
                     
                     # 120초 타임아웃으로 프로세스 완료 대기
                     stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                        process.communicate(),
+                        process.communicate(input=run_request.encode('utf-8')),
                         timeout=120.0
                     )
                     
                     # 바이트를 문자열로 디코드
-                    stdout = stdout_bytes.decode('utf-8', errors='replace') if stdout_bytes else ""
-                    stderr = stderr_bytes.decode('utf-8', errors='replace') if stderr_bytes else ""
+                    stdout = await _decode_output(stdout_bytes)
+                    stderr = await _decode_output(stderr_bytes)
                     returncode = process.returncode
                     
                 except asyncio.TimeoutError:
                     print(f"[Execution] Process timeout, terminating...")
-                    process.terminate()
-                    await asyncio.sleep(0.5)
-                    if process.returncode is None:
-                        process.kill()
+                    await _terminate_process_group(process)
                     return {"success": False, "error": "Code execution timeout (120s)"}
             
             # stdout의 전체 내용 출력 (디버깅용)
@@ -695,6 +931,9 @@ except Exception as e:
             execution_logs = []
             
             for line in stdout_lines:
+                # 마커 줄만 확인 (일반 출력 줄은 바로 건너뜀)
+                if not line.startswith("###"):
+                    continue
                 if line.startswith("###AI_REQUEST_START###"):
                     execution_logs.append({"type": "ai_request", "message": "Sending request to AI model"})
                 elif line.startswith("###AI_RESPONSE_RECEIVED###"):
@@ -721,29 +960,19 @@ except Exception as e:
             output_path = os.path.join(temp_dir, "output.json")
             if os.path.exists(output_path):
                 try:
-                    with open(output_path, "r", encoding="utf-8") as f:
-                        result_data = json.load(f)
-                        result_data["execution_logs"] = execution_logs
-                        
-                        # 디버깅 정보 추가
-                        print(f"[Execution] Successfully loaded output from file: {json.dumps(result_data)[:100]}...")
-                        
-                        return result_data
+                    with open(output_path, "rb") as f:
+                        raw_output = f.read()
+                    result_data = _load_output(raw_output)
+                    result_data["execution_logs"] = execution_logs
+                    
+                    # 디버깅 정보 추가 (결과 전체를 다시 직렬화하지 않고 크기만 출력)
+                    print(f"[Execution] Successfully loaded output from file: {len(raw_output)} bytes")
+                    
+                    return result_data
                 except Exception as e:
                     print(f"[Execution] Error reading output file: {e}")
             
-            # 파일이 없으면 stdout에서 FINAL_OUTPUT 찾기
-            for line in stdout_lines:
-                if line.startswith("###FINAL_OUTPUT###"):
-                    try:
-                        json_str = line.replace("###FINAL_OUTPUT###", "").strip()
-                        result_data = json.loads(json_str)
-                        result_data["execution_logs"] = execution_logs
-                        return result_data
-                    except Exception as e:
-                        print(f"[Execution] Error parsing FINAL_OUTPUT: {e}")
-            
-            # 그래도 못 찾으면 에러 반환
+            # 결과 파일이 없거나 읽을 수 없으면 에러 반환
             return {
                 "success": False,
                 "error": "Could not capture output from code execution",
@@ -8,6 +8,8 @@ from .configs import (
     WEB_SEARCH_PATTERNS
 )
 from .helpers import (
+    generate_id,
+    get_id_timestamp,
     format_timestamp,
     format_duration,
     needs_web_search,
@@ -22,6 +24,8 @@ __all__ = [
     'WORKFLOW_PHASES',
     'DEFAULT_AI_MODELS',
     'WEB_SEARCH_PATTERNS',
+    'generate_id',
+    'get_id_timestamp',
     'format_timestamp',
     'format_duration',
     'needs_web_search',
@@ -12,6 +12,9 @@ from .network_discovery import NetworkDiscovery, NetworkDevice
 
 logger = logging.getLogger(__name__)
 
+# 작업 ID 해시의 공통 접두 상태 (작업마다 copy()로 분기)
+_TASK_ID_HASH_BASE = hashlib.blake2b(b"task_", digest_size=6)
+
 @dataclass
 class DistributedTask:
     """분산 작업"""
@@ -174,9 +177,14 @@ class DistributedAIExecutor:
     ) -> str:
         """작업 제출"""
         
-        # 작업 ID 생성
-        task_data = f"{prompt}_{model}_{datetime.now().isoformat()}"
-        task_id = hashlib.md5(task_data.encode()).hexdigest()[:12]
+        # 작업 ID 생성 (긴 프롬프트를 다시 이어 붙이지 않고 조각별로 해시에 공급)
+        id_hash = _TASK_ID_HASH_BASE.copy()
+        id_hash.update(prompt.encode())
+        id_hash.update(b"_")
+        id_hash.update(model.encode())
+        id_hash.update(b"_")
+        id_hash.update(datetime.now().isoformat().encode())
+        task_id = id_hash.hexdigest()
         
         # 작업 생성
         task = DistributedTask(
@@ -7,9 +7,25 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 import random
 import logging
+import itertools
+import time
 
 logger = logging.getLogger(__name__)
 
+# ID 생성 헬퍼
+_id_counter = itertools.count()
+
+def generate_id(prefix: str) -> str:
+    """접두사가 붙은 고유 ID 생성 (같은 시각에 연달아 호출돼도 카운터로 구분)"""
+    return f"{prefix}_{time.time_ns()}_{next(_id_counter)}"
+
+def get_id_timestamp(id_str: str) -> Optional[float]:
+    """generate_id로 만든 ID에서 생성 시각(초 단위 epoch) 추출"""
+    try:
+        return int(id_str.rsplit("_", 2)[1]) / 1e9
+    except (IndexError, ValueError):
+        return None
+
 # 시간 관련 헬퍼
 def format_timestamp(timestamp: str) -> str:
     """타임스탬프를 읽기 쉬운 형식으로 변환"""
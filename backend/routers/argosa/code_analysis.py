@@ -15,17 +15,62 @@ import hashlib
 from dataclasses import dataclass, asdict
 import re
 from collections import defaultdict
+from functools import lru_cache
 import traceback
 import logging
 
+# 선택적 고속 해시 (없으면 표준 라이브러리 해시 사용)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # 기존 imports
 from ...services.rag_service import rag_service, module_integration, Document, RAGQuery
 from .data_analysis import enhanced_agent_system, EnhancedAgentType
+from .analysis import generate_id
 from .data_collection import comprehensive_data_collector
+from ...ws_utils import encode_message, decode_message, broadcast_text, now_iso
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# ===== 파일 분류 테이블 =====
+
+# 스캔 시 분류할 파일 종류별 확장자
+FILE_TYPE_FILTERS: Dict[str, Tuple[str, ...]] = {
+    "python": (".py",),
+    "config": (".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".env"),
+}
+
+# 확장자 -> 종류 (모듈 로드 시 한 번만 생성, O(1) 분류)
+_EXT_TO_KIND: Dict[str, str] = {
+    ext: kind for kind, exts in FILE_TYPE_FILTERS.items() for ext in exts
+}
+
+# 스캔에서 제외할 디렉토리 (점으로 시작하는 디렉토리는 별도로 제외)
+_SKIP_DIRS = frozenset({"__pycache__"})
+
+# 스캔 시 동시에 읽을 최대 파일 수
+_MAX_CONCURRENT_READS = 32
+
+@lru_cache(maxsize=256)
+def _parse_code(code: str) -> ast.Module:
+    """코드 문자열 파싱 (같은 코드를 여러 검증 단계에서 다시 파싱하지 않도록 캐시)
+    
+    반환된 AST는 공유되므로 호출 측에서 수정하면 안 된다.
+    """
+    return ast.parse(code)
+
+def _fast_hash(data: bytes) -> int:
+    """비암호화 고속 64비트 해시 (버킷 분류용, 동일성 확정은 별도 해시로)
+    
+    문자열 대신 정수를 키로 써서 버킷 dict의 해시/비교 비용을 줄인다.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
 # ===== 고급 데이터 모델 =====
 
 @dataclass
@@ -75,7 +120,7 @@ class ArchitecturePattern(BaseModel):
 
 class CodeGenerationPlan(BaseModel):
     """코드 생성 계획"""
-    plan_id: str = Field(default_factory=lambda: f"plan_{datetime.now().timestamp()}")
+    plan_id: str = Field(default_factory=lambda: generate_id("plan"))
     objective: str
     scope: str  # file, module, system
     
@@ -106,7 +151,7 @@ class CodeGenerationPlan(BaseModel):
 
 class CodeFragment(BaseModel):
     """코드 조각"""
-    fragment_id: str = Field(default_factory=lambda: f"frag_{datetime.now().timestamp()}")
+    fragment_id: str = Field(default_factory=lambda: generate_id("frag"))
     fragment_type: str  # function, class, module, test, config
     content: str
     language: str = "python"
@@ -162,17 +207,14 @@ class AdvancedProjectAnalyzer:
         print("[프로젝트 분석] 코드 엔티티 추출 중...")
         await self._extract_code_entities(analysis_result)
         
-        # 3. 의존성 그래프 구축
-        print("[프로젝트 분석] 의존성 그래프 구축 중...")
-        await self._build_dependency_graph(analysis_result)
-        
-        # 4. 아키텍처 패턴 분석
-        print("[프로젝트 분석] 아키텍처 패턴 분석 중...")
-        await self._analyze_architecture_patterns(analysis_result)
-        
-        # 5. 코드 품질 분석
-        print("[프로젝트 분석] 코드 품질 분석 중...")
-        await self._analyze_code_quality(analysis_result)
+        # 3~5. 의존성 그래프 / 아키텍처 패턴 / 코드 품질 분석
+        # 셋 다 엔티티 맵만 읽고 서로 다른 결과 키에 쓰므로 동시에 실행
+        print("[프로젝트 분석] 의존성 그래프, 아키텍처 패턴, 코드 품질 분석 중...")
+        await asyncio.gather(
+            self._build_dependency_graph(analysis_result),
+            self._analyze_architecture_patterns(analysis_result),
+            self._analyze_code_quality(analysis_result)
+        )
         
         # 6. 개선 기회 식별
         print("[프로젝트 분석] 개선 기회 식별 중...")
@@ -196,50 +238,102 @@ class AdvancedProjectAnalyzer:
             "comment_lines": 0,
             "blank_lines": 0
         }
+        source_files: List[Tuple[str, os.stat_result]] = []
         
-        for root, dirs, files in os.walk(root_path):
-            # .git, __pycache__ 등 제외
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+        # os.scandir로 직접 순회 - DirEntry의 stat 결과를 읽기 단계까지 넘겨 파일마다 다시 stat하지 않음
+        pending_dirs = [root_path]
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
             
-            for file in files:
-                file_path = os.path.join(root, file)
+            for entry in entries:
+                if entry.is_dir():
+                    # .git, __pycache__ 등 제외 (심볼릭 링크 디렉토리는 따라가지 않음)
+                    if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS and not entry.is_symlink():
+                        pending_dirs.append(entry.path)
+                    continue
+                
+                file = entry.name
                 file_stats["total_files"] += 1
                 
-                if file.endswith('.py'):
+                kind = _EXT_TO_KIND.get(os.path.splitext(file)[1].lower())
+                if kind == "config":
+                    file_stats["config_files"] += 1
+                elif kind == "python":
                     file_stats["python_files"] += 1
                     if 'test_' in file or '_test.py' in file:
                         file_stats["test_files"] += 1
                     
-                    # 파일 내용 분석
                     try:
-                        async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                            content = await f.read()
-                            lines = content.splitlines()
-                            
-                            file_stats["total_lines"] += len(lines)
-                            
-                            # 라인 유형 분석
-                            for line in lines:
-                                stripped = line.strip()
-                                if not stripped:
-                                    file_stats["blank_lines"] += 1
-                                elif stripped.startswith('#'):
-                                    file_stats["comment_lines"] += 1
-                                else:
-                                    file_stats["code_lines"] += 1
-                            
-                            # 파일 캐시에 저장
-                            self.file_cache[file_path] = {
-                                "content": content,
-                                "lines": lines,
-                                "hash": hashlib.md5(content.encode()).hexdigest(),
-                                "last_modified": os.path.getmtime(file_path)
-                            }
-                    except Exception as e:
-                        print(f"[프로젝트 분석] 파일 읽기 오류 {file_path}: {e}")
+                        source_files.append((entry.path, entry.stat()))
+                    except OSError:
+                        continue
+        
+        # 파일 내용 분석 (파일 읽기 I/O 대기가 겹치도록 동시 실행)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+        
+        async def read_with_limit(file_path: str, stat: os.stat_result):
+            async with semaphore:
+                await self._read_source_file(file_path, file_stats, stat)
+        
+        await asyncio.gather(*(read_with_limit(p, st) for p, st in source_files))
         
         result["statistics"]["files"] = file_stats
     
+    async def _read_source_file(self, file_path: str, file_stats: Dict[str, int],
+                                stat: Optional[os.stat_result] = None):
+        """소스 파일 하나를 읽어 라인 통계를 누적하고 캐시에 저장
+        
+        이전 스캔 이후 (mtime_ns, size)가 그대로인 파일은 다시 읽지 않고
+        캐시된 내용과 라인 통계를 재사용한다.
+        """
+        try:
+            if stat is None:
+                stat = os.stat(file_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            
+            cached = self.file_cache.get(file_path)
+            if cached and cached.get("signature") == signature:
+                line_counts = cached["line_counts"]
+            else:
+                async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                    content = await f.read()
+                lines = content.splitlines()
+                
+                # 라인 유형 분석
+                line_counts = {
+                    "total_lines": len(lines),
+                    "code_lines": 0,
+                    "comment_lines": 0,
+                    "blank_lines": 0
+                }
+                for line in lines:
+                    stripped = line.strip()
+                    if not stripped:
+                        line_counts["blank_lines"] += 1
+                    elif stripped.startswith('#'):
+                        line_counts["comment_lines"] += 1
+                    else:
+                        line_counts["code_lines"] += 1
+                
+                # 파일 캐시에 저장
+                self.file_cache[file_path] = {
+                    "content": content,
+                    "lines": lines,
+                    "size": stat.st_size,
+                    "last_modified": stat.st_mtime,
+                    "signature": signature,
+                    "line_counts": line_counts
+                }
+            
+            for key, count in line_counts.items():
+                file_stats[key] += count
+        except Exception as e:
+            print(f"[프로젝트 분석] 파일 읽기 오류 {file_path}: {e}")
+    
     async def _extract_code_entities(self, result: Dict[str, Any]):
         """모든 코드 엔티티 추출"""
         
@@ -256,7 +350,11 @@ class AdvancedProjectAnalyzer:
                 continue
             
             try:
-                tree = ast.parse(file_data["content"])
+                # 내용이 바뀌지 않은 파일은 이전 스캔의 AST 재사용 (재읽기 시 캐시 항목이 교체됨)
+                tree = file_data.get("tree")
+                if tree is None:
+                    tree = ast.parse(file_data["content"], filename=file_path)
+                    file_data["tree"] = tree
                 
                 # AST를 순회하며 엔티티 추출
                 for node in ast.walk(tree):
@@ -606,11 +704,82 @@ class AdvancedProjectAnalyzer:
         python_files = result["statistics"]["files"]["python_files"]
         quality_metrics["test_coverage_estimate"] = (test_files / python_files * 100) if python_files > 0 else 0
         
+        # 중복 파일 검사 (해시 계산은 스레드에서 - 동시에 실행 중인 다른 분석 단계를 막지 않도록)
+        quality_metrics["code_duplication"] = await self._find_duplicate_files()
+        
         # 코드 스멜 검사
         quality_metrics["code_smells"] = await self._detect_code_smells()
         
         result["quality_metrics"] = quality_metrics
     
+    async def _find_duplicate_files(self) -> List[Dict[str, Any]]:
+        """내용이 동일한 파일 탐지
+        
+        공유 중인 file_cache는 이벤트 루프에서만 읽고 쓴다. 항목 스냅샷을 떠서
+        해시 계산만 스레드에서 하고, 새로 계산한 지문은 루프로 돌아와 캐시에 반영한다.
+        """
+        entries = [
+            (file_path, file_data["size"], file_data["content"],
+             file_data.get("fingerprint"), len(file_data["lines"]))
+            for file_path, file_data in self.file_cache.items()
+        ]
+        snapshot = dict(self.file_cache)
+        
+        duplicates, fingerprints = await asyncio.to_thread(self._group_duplicate_files, entries)
+        
+        # 그 사이 다시 읽혀 교체된 항목에는 이전 내용의 지문을 쓰지 않음
+        for file_path, fingerprint in fingerprints.items():
+            file_data = self.file_cache.get(file_path)
+            if file_data is not None and file_data is snapshot[file_path]:
+                file_data["fingerprint"] = fingerprint
+        
+        return duplicates
+    
+    @staticmethod
+    def _group_duplicate_files(
+        entries: List[Tuple[str, int, str, Optional[int], int]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """(경로, 크기, 내용, 지문, 줄 수) 스냅샷에서 동일 파일 묶기 (스레드에서 실행)
+        
+        크기가 같은 파일끼리만 후보로 삼고, 후보들은 고속 해시로 묶은 뒤
+        같은 버킷에 2개 이상 있을 때만 blake2b로 동일성을 확정한다.
+        새로 계산한 고속 해시는 (경로 -> 지문)으로 함께 반환한다.
+        """
+        size_index: Dict[int, List[Tuple[str, str, Optional[int], int]]] = defaultdict(list)
+        for file_path, size, content, fingerprint, line_count in entries:
+            size_index[size].append((file_path, content, fingerprint, line_count))
+        
+        duplicates = []
+        new_fingerprints: Dict[str, int] = {}
+        for size, candidates in size_index.items():
+            if len(candidates) < 2 or size == 0:
+                continue
+            
+            buckets: Dict[int, List[Tuple[str, str, int]]] = defaultdict(list)
+            for file_path, content, fingerprint, line_count in candidates:
+                if fingerprint is None:
+                    fingerprint = _fast_hash(content.encode())
+                    new_fingerprints[file_path] = fingerprint
+                buckets[fingerprint].append((file_path, content, line_count))
+            
+            for bucket in buckets.values():
+                if len(bucket) < 2:
+                    continue
+                
+                confirmed: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+                for file_path, content, line_count in bucket:
+                    confirmed[hashlib.blake2b(content.encode()).hexdigest()].append((file_path, line_count))
+                
+                for digest, same_files in confirmed.items():
+                    if len(same_files) > 1:
+                        duplicates.append({
+                            "hash": digest,
+                            "files": [file_path for file_path, _ in same_files],
+                            "lines": same_files[0][1]
+                        })
+        
+        return duplicates, new_fingerprints
+    
     async def _detect_code_smells(self) -> List[Dict[str, Any]]:
         """코드 스멜 감지"""
         code_smells = []
@@ -1272,7 +1441,7 @@ class AdvancedCodeGenerationEngine:
         testable_entities = []
         
         try:
-            tree = ast.parse(code)
+            tree = _parse_code(code)
             
             for node in ast.walk(tree):
                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -1586,17 +1755,21 @@ class RealtimeCodeCollaborationSystem:
     def __init__(self):
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
         self.websocket_connections: Dict[str, WebSocket] = {}
+        # 세션 -> 웹소켓 ID 역인덱스 (브로드캐스트/해제 시 전체 연결을 훑지 않도록)
+        self.session_connections: Dict[str, Set[str]] = {}
         self.message_queue: asyncio.Queue = asyncio.Queue()
     
     def __init__(self):
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
         self.websocket_connections: Dict[str, WebSocket] = {}
+        # 세션 -> 웹소켓 ID 역인덱스 (브로드캐스트/해제 시 전체 연결을 훑지 않도록)
+        self.session_connections: Dict[str, Set[str]] = {}
         self.message_queue: asyncio.Queue = asyncio.Queue()
         
     async def create_collaboration_session(self, request: Dict[str, Any]) -> str:
         """협업 세션 생성"""
         
-        session_id = f"collab_{datetime.now().timestamp()}"
+        session_id = generate_id("collab")
         
         session = {
             "session_id": session_id,
@@ -1624,7 +1797,7 @@ class RealtimeCodeCollaborationSystem:
             return
         
         session = self.active_sessions[session_id]
-        message["timestamp"] = datetime.now().isoformat()
+        message["timestamp"] = now_iso()
         session["message_history"].append(message)
         
         # 메시지 유형별 처리
@@ -1727,15 +1900,35 @@ class RealtimeCodeCollaborationSystem:
             "timestamp": datetime.now().isoformat()
         }
     
+    def add_connection(self, session_id: str, ws_id: str, websocket: WebSocket):
+        """세션 웹소켓 연결 등록"""
+        self.websocket_connections[ws_id] = websocket
+        self.session_connections.setdefault(session_id, set()).add(ws_id)
+    
+    def remove_connection(self, session_id: str, ws_id: str):
+        """세션 웹소켓 연결 해제"""
+        self.websocket_connections.pop(ws_id, None)
+        ws_ids = self.session_connections.get(session_id)
+        if ws_ids is not None:
+            ws_ids.discard(ws_id)
+            if not ws_ids:
+                del self.session_connections[session_id]
+    
     async def _broadcast_to_session(self, session_id: str, message: Dict[str, Any]):
         """세션 참가자들에게 메시지 브로드캐스트"""
         
-        for ws_id, ws in self.websocket_connections.items():
-            if ws_id.startswith(session_id):
-                try:
-                    await ws.send_json(message)
-                except Exception as e:
-                    print(f"[협업] 웹소켓 전송 오류: {e}")
+        ws_ids = self.session_connections.get(session_id)
+        if not ws_ids:
+            return
+        
+        payload = encode_message(message)
+        targets = [
+            (ws_id, self.websocket_connections[ws_id])
+            for ws_id in ws_ids
+            if ws_id in self.websocket_connections
+        ]
+        for _, e in await broadcast_text(targets, payload):
+            print(f"[협업] 웹소켓 전송 오류: {e}")
 
 # ===== 전역 인스턴스 =====
 
@@ -1797,18 +1990,18 @@ async def code_collaboration_websocket(websocket: WebSocket, session_id: str):
     """실시간 코드 협업 웹소켓"""
     
     await websocket.accept()
-    ws_id = f"{session_id}_{datetime.now().timestamp()}"
-    collaboration_system.websocket_connections[ws_id] = websocket
+    ws_id = generate_id(session_id)
+    collaboration_system.add_connection(session_id, ws_id, websocket)
     
     try:
         while True:
-            data = await websocket.receive_json()
+            data = decode_message(await websocket.receive_text())
             await collaboration_system.handle_collaboration_message(session_id, data)
             
     except Exception as e:
         print(f"[협업] 웹소켓 오류: {e}")
     finally:
-        del collaboration_system.websocket_connections[ws_id]
+        collaboration_system.remove_connection(session_id, ws_id)
         await websocket.close()
 
 @router.post("/ai-models/configure")
@@ -1903,7 +2096,7 @@ async def create_collaboration_session(request: Dict[str, Any]):
 async def _validate_syntax(code: str) -> Dict[str, Any]:
     """문법 검증"""
     try:
-        ast.parse(code)
+        _parse_code(code)
         return {"valid": True}
     except SyntaxError as e:
         return {
@@ -1945,7 +2138,7 @@ async def _validate_complexity(code: str) -> Dict[str, Any]:
     """복잡도 검증"""
     
     try:
-        tree = ast.parse(code)
+        tree = _parse_code(code)
         complexities = []
         
         for node in ast.walk(tree):
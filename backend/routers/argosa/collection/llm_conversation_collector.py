@@ -1,15 +1,24 @@
 # backend/routers/argosa/collection/llm_conversation_collector.py - LLM 플랫폼 대화 수집 모듈
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from pydantic import BaseModel
+from collections import Counter
 import json
+import os
 import logging
 import asyncio
+import re
 import uuid
 
+# orjson이 있으면 대화 파일 파싱/저장에 사용, 없으면 표준 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # ======================== Configuration ========================
@@ -17,6 +26,36 @@ logger = logging.getLogger(__name__)
 LLM_DATA_PATH = Path("./data/argosa/llm-conversations")
 SUPPORTED_PLATFORMS = ["chatgpt", "claude", "gemini", "deepseek", "grok", "perplexity", "pplx"]
 
+# 인사이트 키워드 토큰 (공백 기준, 4글자 이상만)
+_KEYWORD_RE = re.compile(r"\S{4,}")
+
+def _read_json(path: Path) -> Any:
+    """JSON 파일 읽기"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path: Path, data: Any):
+    """JSON 파일 쓰기 (들여쓰기 2칸, 비ASCII 문자 그대로 저장)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def _write_jsonl(path: Path, records: Iterable[Dict[str, Any]]):
+    """JSONL 파일 쓰기 (레코드 단위로 스트리밍, 전체 배열을 메모리에 만들지 않음)"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            for record in records:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+
 # ======================== Data Models ========================
 
 class ConversationData(BaseModel):
@@ -54,6 +93,10 @@ class LLMConversationCollector:
         self.platforms = SUPPORTED_PLATFORMS
         self.collection_history = {}
         self.llm_conversation_ids = set()  # LLM 질의로 생성된 대화 ID 추적
+        # 파일별 통계 캐시: 경로 -> (mtime_ns, size, 대화 수, 제외된 LLM 대화 수)
+        self._file_stats_cache: Dict[str, Tuple[int, int, int, int]] = {}
+        # (플랫폼, 날짜) -> 마지막으로 사용한 파일 번호 (저장할 때마다 디렉토리를 다시 훑지 않도록)
+        self._file_counters: Dict[Tuple[str, str], int] = {}
         self._ensure_directories()
         
     def _ensure_directories(self):
@@ -76,6 +119,8 @@ class LLMConversationCollector:
         
         if platform not in self.platforms:
             raise ValueError(f"Unsupported platform: {platform}")
+        # 저장 시각은 한 번만 계산해 재사용
+        now_iso = datetime.now().isoformat()
         # conversation_saver 사용
         try:
             from ..shared.conversation_saver import conversation_saver
@@ -86,13 +131,13 @@ class LLMConversationCollector:
                 metadata={
                     **metadata,
                     "source": "llm_collector",
-                    "timestamp": timestamp or datetime.now().isoformat()
+                    "timestamp": timestamp or now_iso
                 }
             )
             
             # 히스토리 업데이트
             self.collection_history[platform] = {
-                "last_sync": datetime.now().isoformat(),
+                "last_sync": now_iso,
                 "conversation_count": result.get("count", 0),
                 "excluded_llm_count": result.get("excluded_llm_count", 0)
             }
@@ -150,12 +195,19 @@ class LLMConversationCollector:
             }
         
         platform_path = LLM_DATA_PATH / platform
-        timestamp = timestamp or datetime.now().isoformat()
+        # 저장 시각은 한 번만 계산해 재사용
+        now = datetime.now()
+        now_iso = now.isoformat()
+        timestamp = timestamp or now_iso
         
         # 파일명 생성
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        file_count = len(list(platform_path.glob(f"{date_str}_*.json")))
-        filename = f"{date_str}_conversation_{file_count + 1}.json"
+        date_str = now.strftime("%Y-%m-%d")
+        counter_key = (platform, date_str)
+        if counter_key not in self._file_counters:
+            # 해당 날짜의 첫 저장일 때만 기존 파일 수로 초기화
+            self._file_counters[counter_key] = len(list(platform_path.glob(f"{date_str}_*.json")))
+        self._file_counters[counter_key] += 1
+        filename = f"{date_str}_conversation_{self._file_counters[counter_key]}.json"
         
         # 대화 데이터 구성
         save_data = {
@@ -166,7 +218,7 @@ class LLMConversationCollector:
                 "count": len(filtered_conversations),
                 "excluded_llm_count": excluded_count,
                 "total_before_filter": len(conversations),
-                "collected_at": datetime.now().isoformat(),
+                "collected_at": now_iso,
                 **metadata
             }
         }
@@ -176,8 +228,8 @@ class LLMConversationCollector:
         temp_path = file_path.with_suffix('.tmp')
 
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            # 대용량 쓰기는 스레드에서 (이벤트 루프 블로킹 방지)
+            await asyncio.to_thread(_write_json, temp_path, save_data)
             
             temp_path.replace(file_path)
         except Exception as e:
@@ -189,7 +241,7 @@ class LLMConversationCollector:
         
         # 히스토리 업데이트
         self.collection_history[platform] = {
-            "last_sync": datetime.now().isoformat(),
+            "last_sync": now_iso,
             "last_file": filename,
             "conversation_count": len(filtered_conversations),
             "excluded_llm_count": excluded_count
@@ -227,8 +279,7 @@ class LLMConversationCollector:
                 break
                 
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _read_json(file)
                     
                 for conv in data.get("conversations", []):
                     # LLM 대화 필터링 (include_llm이 False인 경우)
@@ -272,25 +323,44 @@ class LLMConversationCollector:
             total_conversations = 0
             excluded_llm_count = 0
             file_count = 0
-            latest_sync = None
+            latest_mtime = None  # epoch float로 비교하고 마지막에 한 번만 datetime 변환
             
-            for file in platform_path.glob("*.json"):
+            # os.scandir의 DirEntry stat을 그대로 사용 (glob + Path.stat 반복 대신 한 번의 디렉토리 순회)
+            try:
+                with os.scandir(platform_path) as it:
+                    entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+            except OSError:
+                entries = []
+            
+            for entry in entries:
                 file_count += 1
                 
                 try:
-                    with open(file, 'r') as f:
-                        data = json.load(f)
+                    file_stat = entry.stat()
+                    cache_key = entry.path
+                    cached = self._file_stats_cache.get(cache_key)
+                    
+                    # 변경되지 않은 파일은 다시 파싱하지 않음
+                    if cached and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+                        conv_count, excluded_count = cached[2], cached[3]
+                    else:
+                        data = _read_json(Path(entry.path))
                         conv_count = len(data.get("conversations", []))
-                        total_conversations += conv_count
                         
                         # 메타데이터에서 제외된 LLM 대화 수 확인
                         metadata = data.get("metadata", {})
-                        excluded_llm_count += metadata.get("excluded_llm_count", 0)
+                        excluded_count = metadata.get("excluded_llm_count", 0)
                         
-                        # 최신 동기화 시간
-                        file_time = datetime.fromtimestamp(file.stat().st_mtime)
-                        if not latest_sync or file_time > latest_sync:
-                            latest_sync = file_time
+                        self._file_stats_cache[cache_key] = (
+                            file_stat.st_mtime_ns, file_stat.st_size, conv_count, excluded_count
+                        )
+                    
+                    total_conversations += conv_count
+                    excluded_llm_count += excluded_count
+                    
+                    # 최신 동기화 시간
+                    if latest_mtime is None or file_stat.st_mtime > latest_mtime:
+                        latest_mtime = file_stat.st_mtime
                             
                 except Exception:
                     continue
@@ -300,7 +370,7 @@ class LLMConversationCollector:
                 total_conversations=total_conversations,
                 new_conversations=0,  # 실시간 계산 필요
                 updated_conversations=0,
-                last_sync=latest_sync.isoformat() if latest_sync else None,
+                last_sync=datetime.fromtimestamp(latest_mtime).isoformat() if latest_mtime is not None else None,
                 file_count=file_count
             )
         
@@ -324,6 +394,7 @@ class LLMConversationCollector:
                     
                     if file_date < cutoff_date:
                         file.unlink()
+                        self._file_stats_cache.pop(str(file), None)
                         deleted_count += 1
                         
                 except Exception as e:
@@ -365,8 +436,7 @@ class LLMConversationCollector:
                                 continue
                     
                     # 파일 내용 검색
-                    with open(file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _read_json(file)
                         
                     for conv in data.get("conversations", []):
                         # LLM 대화 필터링
@@ -440,9 +510,14 @@ class LLMConversationCollector:
             filename = f"{platform}_export_{timestamp}.json"
             file_path = export_path / filename
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump([conv.dict() for conv in conversations], f, 
-                         ensure_ascii=False, indent=2)
+            await asyncio.to_thread(_write_json, file_path, [conv.dict() for conv in conversations])
+        
+        elif format == "jsonl":
+            # 학습 데이터셋용: 한 줄에 대화 하나
+            filename = f"{platform}_export_{timestamp}.jsonl"
+            file_path = export_path / filename
+            
+            await asyncio.to_thread(_write_jsonl, file_path, (conv.dict() for conv in conversations))
         
         elif format == "txt":
             filename = f"{platform}_export_{timestamp}.txt"
@@ -479,11 +554,11 @@ class LLMConversationCollector:
         total_messages = sum(len(conv.messages) for conv in conversations)
         
         # 시간대별 분포
-        hourly_distribution = {}
-        daily_distribution = {}
+        hourly_distribution = Counter()
+        daily_distribution = Counter()
         
         # 주제 분석 (간단한 키워드 추출)
-        word_frequency = {}
+        word_frequency = Counter()
         
         for conv in conversations:
             # 시간 분석
@@ -491,25 +566,22 @@ class LLMConversationCollector:
             hour = created_time.hour
             day = created_time.strftime("%A")
             
-            hourly_distribution[hour] = hourly_distribution.get(hour, 0) + 1
-            daily_distribution[day] = daily_distribution.get(day, 0) + 1
+            hourly_distribution[hour] += 1
+            daily_distribution[day] += 1
             
-            # 키워드 추출 (제목에서)
-            words = conv.title.lower().split()
-            for word in words:
-                if len(word) > 3:  # 짧은 단어 제외
-                    word_frequency[word] = word_frequency.get(word, 0) + 1
+            # 키워드 추출 (제목에서, 짧은 단어는 정규식에서 제외)
+            word_frequency.update(_KEYWORD_RE.findall(conv.title.lower()))
         
         # 상위 키워드
-        top_keywords = sorted(word_frequency.items(), key=lambda x: x[1], reverse=True)[:20]
+        top_keywords = word_frequency.most_common(20)
         
         return {
             "platform": platform,
             "total_conversations": total_conversations,
             "total_messages": total_messages,
             "avg_messages_per_conversation": total_messages / total_conversations if total_conversations > 0 else 0,
-            "hourly_distribution": hourly_distribution,
-            "daily_distribution": daily_distribution,
+            "hourly_distribution": dict(hourly_distribution),
+            "daily_distribution": dict(daily_distribution),
             "top_keywords": top_keywords,
             "analysis_timestamp": datetime.now().isoformat()
         }
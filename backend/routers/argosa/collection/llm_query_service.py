@@ -9,6 +9,7 @@ import json
 import logging
 import asyncio
 from collections import deque, defaultdict
+from itertools import islice
 import hashlib
 import uuid
 
@@ -192,7 +193,7 @@ class LLMQueryService:
             "system_prompt": request.system_prompt
         }
         key_str = json.dumps(key_data, sort_keys=True)
-        return f"llm_query:{hashlib.sha256(key_str.encode()).hexdigest()}"
+        return f"llm_query:{hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()}"
     
     async def process_query(self, request: LLMQueryRequest) -> LLMResponse:
         """질의 처리"""
@@ -588,7 +589,10 @@ class LLMQueryService:
     async def get_query_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """질의 히스토리 조회"""
         
-        return list(self.query_history)[-limit:]
+        # 전체 히스토리를 복사하지 않고 뒤에서부터 필요한 만큼만 꺼냄
+        recent = list(islice(reversed(self.query_history), limit))
+        recent.reverse()
+        return recent
     
     async def shutdown(self):
         """정리"""
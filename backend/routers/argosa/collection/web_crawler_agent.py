@@ -14,7 +14,9 @@ from langgraph.graph import StateGraph, END
 from langgraph.checkpoint import MemorySaver
 import os
 import sys
+import contextlib
 import hashlib
+import random
 from pathlib import Path
 import aiofiles
 import uuid
@@ -53,6 +55,8 @@ MAX_RETRIES = 3
 BACKOFF_MAX_TIME = 60
 CACHE_TTL = 3600 * 24  # 24시간
 MAX_CONTENT_SIZE = 10 * 1024 * 1024  # 10MB
+# 재시도할 일시적 오류 코드 (408은 Native 응답 타임아웃)
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
 
 # LLM 설정
 LM_STUDIO_URL = os.getenv("LM_STUDIO_URL", "http://localhost:1234/v1")
@@ -63,6 +67,29 @@ CRAWLER_DATA_PATH.mkdir(parents=True, exist_ok=True)
 DOWNLOADS_PATH.mkdir(parents=True, exist_ok=True)
 CACHE_PATH.mkdir(parents=True, exist_ok=True)
 
+def _retry_hint(error: Exception) -> Dict[str, Any]:
+    """예외를 오류 결과로 바꿀 때 재시도 판단에 필요한 정보 (status_code/retryable)"""
+    status_code = getattr(error, "status_code", None)
+    if status_code is not None:
+        return {"status_code": status_code}
+    if isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError)):
+        return {"retryable": True}
+    return {}
+
+def _retry_delay(result: Any, attempt: int) -> Optional[float]:
+    """재시도할 오류 결과면 대기 시간(초), 아니면 None (Retry-After가 있으면 우선)"""
+    if not isinstance(result, dict) or result.get("status") != "error":
+        return None
+    if not (result.get("retryable") or result.get("status_code") in RETRYABLE_STATUS_CODES):
+        return None
+    retry_after = result.get("retry_after")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), BACKOFF_MAX_TIME)
+        except (TypeError, ValueError):
+            pass
+    return min(2 ** attempt + random.random(), BACKOFF_MAX_TIME)
+
 # ===== 웹 크롤링 상태 정의 =====
 
 class WebCrawlerWorkflowState(TypedDict):
@@ -138,6 +165,30 @@ class SecurityValidator:
 
 # ===== 캐시 관리 =====
 
+# ===== 공유 HTTP 세션 =====
+
+# LLM 호출용 기본 타임아웃 (엔진의 콘텐츠 분석은 요청별로 REQUEST_TIMEOUT 적용)
+LLM_REQUEST_TIMEOUT = 60
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """크롤러 구성요소가 함께 쓰는 aiohttp 세션 (커넥션 풀/keep-alive 재사용)"""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=LLM_REQUEST_TIMEOUT)
+        )
+    return _shared_session
+
+async def close_shared_session():
+    """공유 세션 종료"""
+    global _shared_session
+    if _shared_session is not None:
+        await _shared_session.close()
+        _shared_session = None
+
 class CrawlerCache:
     """크롤러 캐시 관리"""
     
@@ -153,7 +204,7 @@ class CrawlerCache:
         if params:
             key_data.update(params)
         key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        return hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
     
     async def get(self, url: str, params: Dict = None) -> Optional[Any]:
         """캐시에서 가져오기"""
@@ -161,8 +212,9 @@ class CrawlerCache:
         
         # 메모리 캐시 확인
         async with self._lock:
-            if key in self.memory_cache:
-                data, cached_time = self.memory_cache[key]
+            entry = self.memory_cache.get(key)
+            if entry is not None:
+                data, cached_time = entry
                 if (datetime.now(timezone.utc) - cached_time).total_seconds() < CACHE_TTL:
                     self.cache_stats['hits'] += 1
                     return data
@@ -231,17 +283,23 @@ class CrawlerCache:
                     for key in expired_keys:
                         del self.memory_cache[key]
                 
-                # 파일 캐시 정리
-                for cache_file in CACHE_PATH.glob("*.json"):
-                    try:
-                        async with aiofiles.open(cache_file, 'r') as f:
-                            cache_data = json.loads(await f.read())
-                            cached_time = datetime.fromisoformat(cache_data['timestamp'])
-                            
-                            if (now - cached_time).total_seconds() > CACHE_TTL:
-                                cache_file.unlink()
-                    except:
-                        pass
+                # 파일 캐시 정리 (캐시 파일은 set()에서 한 번만 쓰이므로 mtime으로 만료 판정)
+                cutoff_ts = now.timestamp() - CACHE_TTL
+                try:
+                    with os.scandir(CACHE_PATH) as it:
+                        for entry in it:
+                            if not entry.name.endswith('.json'):
+                                continue
+                            try:
+                                expired = entry.stat().st_mtime < cutoff_ts
+                            except OSError:
+                                continue
+                            if expired:
+                                with contextlib.suppress(OSError):
+                                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    # 캐시 디렉토리가 실행 중에 삭제된 경우 - 정리할 파일 없음
+                    pass
         except asyncio.CancelledError:
             # 정상적인 종료
             logger.info("Cache cleanup task cancelled")
@@ -304,14 +362,11 @@ class GoogleSearchAPI(BaseAPIClient):
             }
         
         try:
-            # Native Command Manager 가져오기
             if not self._engine:
                 raise RuntimeError("Engine not set for GoogleSearchAPI")
             
-            ncm = await self._engine._get_native_command_manager()
-            
             # Native로 검색 요청
-            command_id = await ncm.send_command(
+            result = await self._engine._native_request(
                 "search_google",
                 {
                     "query": query,
@@ -319,11 +374,10 @@ class GoogleSearchAPI(BaseAPIClient):
                     "cse_id": self.cse_id,
                     "num_results": min(num_results, 10),
                     **kwargs
-                }
+                },
+                timeout=30
             )
             
-            result = await ncm.wait_for_response(command_id, timeout=30)
-            
             if result.get("status") == "success":
                 self.used_today += 1
                 return result
@@ -331,6 +385,8 @@ class GoogleSearchAPI(BaseAPIClient):
                 return {
                     "status": "error",
                     "error": result.get("error", "Search failed"),
+                    "status_code": result.get("status_code"),
+                    "retry_after": result.get("retry_after"),
                     "results": []
                 }
                 
@@ -339,7 +395,8 @@ class GoogleSearchAPI(BaseAPIClient):
                 "status": "error",
                 "error": str(e),
                 "query": query,
-                "results": []
+                "results": [],
+                **_retry_hint(e)
             }
         
 class NewsAPI(BaseAPIClient):
@@ -369,13 +426,10 @@ class NewsAPI(BaseAPIClient):
             from_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
         
         try:
-            # Native Command Manager 가져오기
             if not self._engine:
                 raise RuntimeError("Engine not set for NewsAPI")
             
-            ncm = await self._engine._get_native_command_manager()
-            
-            command_id = await ncm.send_command(
+            return await self._engine._native_request(
                 "search_news",
                 {
                     "query": query,
@@ -384,17 +438,16 @@ class NewsAPI(BaseAPIClient):
                     "sort_by": sort_by,
                     "page_size": page_size,
                     "language": "en"
-                }
+                },
+                timeout=30
             )
-            
-            result = await ncm.wait_for_response(command_id, timeout=30)
-            return result
                 
         except Exception as e:
             return {
                 "status": "error",
                 "error": str(e),
-                "results": []
+                "results": [],
+                **_retry_hint(e)
             }
         
 # ===== 웹 크롤링 엔진 (Native Messaging 전용) =====
@@ -410,14 +463,15 @@ class WebCrawlerEngine:
         self.lm_studio_url = LM_STUDIO_URL
         self._session: Optional[aiohttp.ClientSession] = None
         self._native_command_manager = None  # 초기화 시 설정
+        # 외부 요청 동시 실행 수 제한 (쿼리 변형/사이트 경로 동시 실행 시 과부하 방지)
+        # Native 요청/응답 구간에만 적용 - LLM 분석이나 재시도 대기 중에는 슬롯을 잡지 않음
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
     async def initialize(self):
         """엔진 초기화"""
-        # LLM 세션 생성
+        # LLM 세션 (공유 세션 사용)
         if not self._session:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-            )
+            self._session = await get_shared_session()
         
         # Native Command Manager 가져오기
         try:
@@ -438,12 +492,37 @@ class WebCrawlerEngine:
             "newsapi": news_api,
         }
     
+    async def _with_retry(self, func, *args, **kwargs):
+        """일시적 오류(429/5xx/타임아웃)에 대한 지수 백오프 재시도
+        
+        검색/크롤링 함수는 실패를 예외 대신 {"status": "error"} 결과로 돌려주므로
+        결과의 status_code/retryable 값을 보고 재시도 여부를 정한다.
+        """
+        for attempt in range(MAX_RETRIES):
+            result = await func(*args, **kwargs)
+            delay = _retry_delay(result, attempt)
+            if delay is None or attempt == MAX_RETRIES - 1:
+                return result
+            logger.warning(
+                f"Request failed ({result.get('status_code')}: {result.get('error')}), "
+                f"retrying in {delay:.1f}s ({attempt + 1}/{MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+    
     async def _get_native_command_manager(self):
         """Native Command Manager 가져오기"""
         if not self._native_command_manager:
             raise RuntimeError("Native Command Manager not initialized. Call initialize() first.")
         return self._native_command_manager
     
+    async def _native_request(self, command: str, params: Dict[str, Any],
+                              timeout: int = 30) -> Dict[str, Any]:
+        """Native 명령 전송 + 응답 대기 (동시 요청 수 제한은 이 구간에만 적용)"""
+        ncm = await self._get_native_command_manager()
+        async with self._request_semaphore:
+            command_id = await ncm.send_command(command, params)
+            return await ncm.wait_for_response(command_id, timeout=timeout)
+    
     async def _search_with_api(self, api_name: str, query: str, 
                               options: Dict[str, Any]) -> Dict[str, Any]:
         """API를 통한 검색"""
@@ -459,7 +538,9 @@ class WebCrawlerEngine:
             return {api_name: {"error": "API client not found"}}
         
         try:
-            result = await client.search(query, **options.get(f"{api_name}_params", {}))
+            result = await self._with_retry(
+                client.search, query, **options.get(f"{api_name}_params", {})
+            )
             
             # LLM으로 결과 분석
             if result.get("status") == "success":
@@ -475,15 +556,33 @@ class WebCrawlerEngine:
             logger.error(f"API search error ({api_name}): {e}")
             return {api_name: {"error": str(e)}}
     
+    async def search_web(self, query: str, sources: List[str],
+                         options: Dict[str, Any]) -> Dict[str, Any]:
+        """소스별 검색 (API 검색과 집중 크롤링을 동시에 실행)"""
+        tasks = []
+        if "apis" in sources:
+            tasks.extend(
+                self._search_with_api(api_name, query, options)
+                for api_name in options.get("apis", [])
+            )
+        if "focused" in sources and options.get("focused_sites"):
+            tasks.append(self._focused_crawl(query, options["focused_sites"]))
+        
+        results = {}
+        for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Search source error for '{query}': {outcome}")
+                continue
+            results.update(outcome)
+        
+        return results
+    
     async def _crawl_with_native(self, url: str, query: str) -> Dict[str, Any]:
         """Native Messaging을 사용한 크롤링"""
         
         try:
-            # Native Command Manager 가져오기
-            ncm = await self._get_native_command_manager()
-            
-            # Native로 크롤링 명령 전송
-            command_id = await ncm.send_command(
+            # Native로 크롤링 명령 전송 후 응답 대기
+            result = await self._native_request(
                 "crawl_web",
                 {
                     "url": url,
@@ -491,17 +590,17 @@ class WebCrawlerEngine:
                     "wait_for_element": True,
                     "extract_mode": "smart",  # 스마트 추출 모드
                     "screenshot": True
-                }
+                },
+                timeout=30
             )
             
-            # 응답 대기
-            result = await ncm.wait_for_response(command_id, timeout=30)
-            
             if result.get("error"):
                 return {
                     "url": url,
                     "status": "error",
-                    "error": result["error"]
+                    "error": result["error"],
+                    "status_code": result.get("status_code"),
+                    "retry_after": result.get("retry_after")
                 }
             
             # 콘텐츠 분석
@@ -535,7 +634,8 @@ class WebCrawlerEngine:
             return {
                 "url": url,
                 "status": "error",
-                "error": str(e)
+                "error": str(e),
+                **_retry_hint(e)
             }
     
     async def download_file(self, url: str, filename: str = None) -> Optional[str]:
@@ -620,34 +720,35 @@ class WebCrawlerEngine:
         return "\n\n".join(result)
     
     async def _focused_crawl(self, query: str, focused_sites: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """특정 사이트 집중 크롤링"""
-        focused_results = {}
+        """특정 사이트 집중 크롤링 (경로별 요청은 동시에, 동시 요청 수는 세마포어로 제한)"""
         
-        for site_info in focused_sites:
-            domain = site_info["domain"]
-            valuable_paths = site_info.get("valuable_paths", ["/"])
+        async def crawl_path(url: str) -> Dict[str, Any]:
+            # 캐시 확인
+            cached = await self.cache.get(url)
+            if cached:
+                return cached
             
-            site_results = {}
+            # Native 크롤링
+            result = await self._with_retry(self._crawl_with_native, url, query)
             
-            for path in valuable_paths[:5]:  # 최대 5개 경로
-                url = urljoin(f"https://{domain}", path)
-                
-                # 캐시 확인
-                cached = await self.cache.get(url)
-                if cached:
-                    site_results[path] = cached
-                    continue
-                
-                # Native 크롤링
-                result = await self._crawl_with_native(url, query)
-                
-                # 캐시 저장
-                if result.get("status") == "success":
-                    await self.cache.set(url, result)
-                
-                site_results[path] = result
+            # 캐시 저장
+            if result.get("status") == "success":
+                await self.cache.set(url, result)
             
-            focused_results[domain] = site_results
+            return result
+        
+        targets = [
+            (site_info["domain"], path)
+            for site_info in focused_sites
+            for path in site_info.get("valuable_paths", ["/"])[:5]  # 최대 5개 경로
+        ]
+        results = await asyncio.gather(
+            *(crawl_path(urljoin(f"https://{domain}", path)) for domain, path in targets)
+        )
+        
+        focused_results = {site_info["domain"]: {} for site_info in focused_sites}
+        for (domain, path), result in zip(targets, results):
+            focused_results[domain][path] = result
         
         return {"focused_sites": focused_results}
     
@@ -676,7 +777,8 @@ class WebCrawlerEngine:
             
             async with self._session.post(
                 f"{self.lm_studio_url}/chat/completions",
-                json=payload
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
             ) as response:
                 
                 if response.status != 200:
@@ -832,10 +934,8 @@ Extract key information and return as structured JSON."""
         # 캐시 정리
         await self.cache.shutdown()
         
-        # LLM 세션 정리
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # 공유 세션 참조 해제 (세션 종료는 WebCrawlerAgentSystem.cleanup에서)
+        self._session = None
 
 # ===== 메인 시스템 클래스 (Native 통합) =====
 
@@ -1051,9 +1151,7 @@ class SearchLearningSystem:
     async def initialize(self):
         """초기화"""
         if not self._session:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=60)
-            )
+            self._session = await get_shared_session()
     
     async def evaluate_search_results(self, query: str, results: Dict[str, Any],
                                     objective: str) -> Dict[str, float]:
@@ -1209,9 +1307,8 @@ Return only the improved query string, nothing else."""
     
     async def cleanup(self):
         """정리"""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # 공유 세션 참조 해제 (세션 종료는 WebCrawlerAgentSystem.cleanup에서)
+        self._session = None
 
 # ===== 웹 크롤러 에이전트 시스템 =====
 
@@ -1245,9 +1342,7 @@ class WebCrawlerAgentSystem:
         await self.learning_system.initialize()
         
         if not self._session:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=60)
-            )
+            self._session = await get_shared_session()
         
         logger.info("WebCrawlerAgentSystem initialized")
 
@@ -1405,32 +1500,34 @@ Return as JSON:
         all_results = {}
         query_variations = state.get("search_strategy", {}).get("query_variations", [state["query"]])
         
-        for query_var in query_variations[:3]:  # 최대 3개 변형
-            try:
-                results = await self.crawler_engine.search_web(
-                    query=query_var,
-                    sources=sources,
-                    options=options
-                )
-                
-                # 결과 병합
-                for key, value in results.items():
-                    if key not in all_results:
-                        all_results[key] = value
-                    elif isinstance(value, dict) and isinstance(all_results[key], dict):
-                        # 딕셔너리 병합
-                        all_results[key].update(value)
-                    elif isinstance(value, list) and isinstance(all_results[key], list):
-                        # 리스트 병합
-                        all_results[key].extend(value)
-                        
-            except Exception as e:
-                logger.error(f"Search execution error for '{query_var}': {e}")
+        # 쿼리 변형들을 동시에 검색 (최대 3개 변형)
+        query_variations = query_variations[:3]
+        outcomes = await asyncio.gather(
+            *(self.crawler_engine.search_web(query=query_var, sources=sources, options=options)
+              for query_var in query_variations),
+            return_exceptions=True
+        )
+        
+        for query_var, results in zip(query_variations, outcomes):
+            if isinstance(results, Exception):
+                logger.error(f"Search execution error for '{query_var}': {results}")
                 state["error_log"].append({
                     "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "error": str(e),
+                    "error": str(results),
                     "query": query_var
                 })
+                continue
+            
+            # 결과 병합
+            for key, value in results.items():
+                if key not in all_results:
+                    all_results[key] = value
+                elif isinstance(value, dict) and isinstance(all_results[key], dict):
+                    # 딕셔너리 병합
+                    all_results[key].update(value)
+                elif isinstance(value, list) and isinstance(all_results[key], list):
+                    # 리스트 병합
+                    all_results[key].extend(value)
         
         state["raw_results"] = all_results
         
@@ -1719,8 +1816,7 @@ Provide:
             }
         finally:
             # 정리
-            if search_id in self.active_searches:
-                del self.active_searches[search_id]
+            self.active_searches.pop(search_id, None)
     
     async def get_quota_status(self) -> Dict[str, Any]:
         """API 할당량 상태"""
@@ -1764,9 +1860,8 @@ Provide:
         await self.crawler_engine.cleanup()
         await self.learning_system.cleanup()
         
-        if self._session:
-            await self._session.close()
-            self._session = None
+        self._session = None
+        await close_shared_session()
 
 # ===== API 엔드포인트 =====
 
@@ -1880,15 +1975,19 @@ async def get_search_status(search_id: str):
 async def clear_cache():
     """캐시 정리"""
     
-    cache_files = list(CACHE_PATH.glob("*.json"))
     deleted = 0
     
-    for file in cache_files:
-        try:
-            file.unlink()
-            deleted += 1
-        except:
-            pass
+    try:
+        with os.scandir(CACHE_PATH) as it:
+            for entry in it:
+                if not entry.name.endswith('.json'):
+                    continue
+                with contextlib.suppress(OSError):
+                    os.unlink(entry.path)
+                    deleted += 1
+    except FileNotFoundError:
+        # 캐시 디렉토리가 없으면 지울 파일도 없음 (기존 glob과 동일한 동작)
+        pass
     
     return {
         "deleted_files": deleted,
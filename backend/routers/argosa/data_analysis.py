@@ -24,6 +24,7 @@ from langgraph.checkpoint import MemorySaver
 # 프로젝트 내부 imports
 from ...services.rag_service import rag_service, module_integration, Document, RAGQuery
 from ...services.data_collection import comprehensive_data_collector
+from ...ws_utils import encode_message, decode_message, broadcast_text, now_iso
 
 # 분리된 모듈 imports
 from .analysis import (
@@ -38,6 +39,8 @@ from .analysis import (
     ERROR_MESSAGES,
     EnhancedAgentType,
     # Helpers
+    generate_id,
+    get_id_timestamp,
     format_timestamp,
     format_duration,
     needs_web_search,
@@ -170,7 +173,7 @@ class AnalysisResult:
 
 class AnalysisRequest(BaseModel):
     """분석 요청 모델"""
-    request_id: str = Field(default_factory=lambda: f"req_{datetime.now().timestamp()}")
+    request_id: str = Field(default_factory=lambda: generate_id("req"))
     analysis_type: str
     data_source: Optional[str] = None
     parameters: Dict[str, Any] = {}
@@ -185,7 +188,7 @@ class AnalysisRequest(BaseModel):
 
 class AgentTask(BaseModel):
     """에이전트 작업 정의"""
-    task_id: str = Field(default_factory=lambda: f"task_{datetime.now().timestamp()}")
+    task_id: str = Field(default_factory=lambda: generate_id("task"))
     agent_type: EnhancedAgentType
     task_type: str
     input_data: Dict[str, Any]
@@ -195,7 +198,7 @@ class AgentTask(BaseModel):
 
 class WorkflowDefinition(BaseModel):
     """워크플로우 정의"""
-    workflow_id: str = Field(default_factory=lambda: f"wf_{datetime.now().timestamp()}")
+    workflow_id: str = Field(default_factory=lambda: generate_id("wf"))
     name: str
     description: str
     tasks: List[AgentTask]
@@ -523,7 +526,7 @@ class EnhancedAgentSystem:
         current_task["status"] = "generated"
         
         # 진행상황 업데이트
-        completed = len([t for t in state["subtasks"] if t["status"] != "pending"])
+        completed = sum(1 for t in state["subtasks"] if t["status"] != "pending")
         progress = 40 + (30 * completed / len(state["subtasks"]))
         
         await self._broadcast_progress(state["workflow_id"], {
@@ -863,7 +866,7 @@ class EnhancedAgentSystem:
                 if isinstance(data, dict) and "results" in data:
                     for result in data["results"]:
                         doc = Document(
-                            id=f"web_{source}_{datetime.now().timestamp()}",
+                            id=generate_id(f"web_{source}"),
                             content=json.dumps(result),
                             metadata={
                                 "type": "web_search_result",
@@ -909,7 +912,7 @@ class EnhancedAgentSystem:
             
             # 결과 캐싱
             result_obj = AnalysisResult(
-                analysis_id=f"analysis_{datetime.now().timestamp()}",
+                analysis_id=generate_id("analysis"),
                 timestamp=datetime.now(),
                 agent_type=agent_type,
                 result_type="success",
@@ -1059,19 +1062,20 @@ class TestAuthService:
     async def _broadcast_progress(self, workflow_id: str, progress_data: Dict[str, Any]):
         """WebSocket으로 진행상황 브로드캐스트"""
         
+        if not self.websocket_connections:
+            return
+        
         message = {
             "type": "progress_update",
             "workflow_id": workflow_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             **progress_data
         }
         
-        # 연결된 모든 클라이언트에게 전송
-        for ws_id, websocket in self.websocket_connections.items():
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to send progress to {ws_id}: {e}")
+        # 연결된 모든 클라이언트에게 전송 (한 번만 인코딩)
+        payload = encode_message(message)
+        for ws_id, e in await broadcast_text(self.websocket_connections.items(), payload):
+            logger.error(f"Failed to send progress to {ws_id}: {e}")
     
     async def _simulate_integration(self, request: Dict[str, Any]) -> str:
         """코드 통합 시뮬레이션"""
@@ -1122,7 +1126,7 @@ class TestAuthService:
     async def create_workflow(self, request: AnalysisRequest) -> str:
         """워크플로우 생성"""
         
-        workflow_id = f"wf_{datetime.now().timestamp()}"
+        workflow_id = generate_id("wf")
         
         if request.analysis_type == "code":
             initial_state = CodeWorkflowState(
@@ -1243,8 +1247,7 @@ class TestAuthService:
     
     async def remove_websocket_connection(self, ws_id: str):
         """WebSocket 연결 제거"""
-        if ws_id in self.websocket_connections:
-            del self.websocket_connections[ws_id]
+        if self.websocket_connections.pop(ws_id, None) is not None:
             logger.info(f"WebSocket connection removed: {ws_id}")
     
     async def handle_websocket_message(self, ws_id: str, message: Dict[str, Any]):
@@ -1272,7 +1275,7 @@ class TestAuthService:
                         }
                     }
                 }
-                await self.websocket_connections[ws_id].send_json(metrics_message)
+                await self.websocket_connections[ws_id].send_text(encode_message(metrics_message))
             
             if "agents" in topics:
                 for agent_type, agent in self.agents.items():
@@ -1285,7 +1288,7 @@ class TestAuthService:
                             "performance_metrics": agent["performance_metrics"]
                         }
                     }
-                    await self.websocket_connections[ws_id].send_json(agent_status_message)
+                    await self.websocket_connections[ws_id].send_text(encode_message(agent_status_message))
         
         elif message_type == "subscribe_workflow":
             workflow_id = message.get("workflow_id")
@@ -1298,11 +1301,11 @@ class TestAuthService:
             agent_type = EnhancedAgentType(message.get("agent", "analyst"))
             response = await self._execute_agent(agent_type, message.get("data", {}))
             
-            await self.websocket_connections[ws_id].send_json({
+            await self.websocket_connections[ws_id].send_text(encode_message({
                 "type": "agent_response",
                 "question_id": message.get("question_id"),
                 "response": response
-            })
+            }))
 
 # ===== 전역 인스턴스 =====
 
@@ -1426,14 +1429,14 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     """WebSocket 연결"""
     
     await websocket.accept()
-    ws_id = f"{client_id}_{datetime.now().timestamp()}"
+    ws_id = generate_id(client_id)
     
     await enhanced_agent_system.add_websocket_connection(ws_id, websocket)
     
     try:
         while True:
             # 메시지 수신
-            data = await websocket.receive_json()
+            data = decode_message(await websocket.receive_text())
             
             # 메시지 처리
             await enhanced_agent_system.handle_websocket_message(ws_id, data)
@@ -1474,13 +1477,14 @@ async def list_workflows():
     for workflow_id, state in enhanced_agent_system.active_workflows.items():
         workflow_type = "code" if state.get("task_type") else "analysis"
         current_phase = state.get("current_phase", "unknown")
+        created_at = get_id_timestamp(workflow_id)
         
         workflows.append({
             "workflow_id": workflow_id,
             "type": state.get("task_type", state.get("analysis_type", "unknown")),
             "current_phase": current_phase,
             "progress": calculate_workflow_progress(current_phase, workflow_type, WORKFLOW_PHASES),
-            "created_at": workflow_id.split("_")[1] if "_" in workflow_id else None
+            "created_at": str(created_at) if created_at is not None else None
         })
     
     return {
@@ -1753,7 +1757,7 @@ async def cleanup_old_workflows():
     for workflow_id, state in enhanced_agent_system.active_workflows.items():
         # 워크플로우 ID에서 타임스탬프 추출
         try:
-            timestamp = float(workflow_id.split("_")[1])
+            timestamp = get_id_timestamp(workflow_id)
             created_time = datetime.fromtimestamp(timestamp)
             
             # 24시간 이상 된 워크플로우 제거
@@ -1804,7 +1808,7 @@ async def send_realtime_metrics():
         
         # 각 에이전트의 현재 상태를 실시간 데이터로 변환
         realtime_data = {
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
         for agent_type, agent in enhanced_agent_system.agents.items():
@@ -1821,9 +1825,6 @@ async def send_realtime_metrics():
             "type": "realtime_data",
             "data": realtime_data
         }
+        payload = encode_message(message)
         
-        for ws_id, websocket in enhanced_agent_system.websocket_connections.items():
-            try:
-                await websocket.send_json(message)
-            except:
-                pass
\ No newline at end of file
+        await broadcast_text(enhanced_agent_system.websocket_connections.items(), payload)
\ No newline at end of file
@@ -19,6 +19,12 @@ import psutil
 import threading
 from enum import Enum
 
+# orjson이 있으면 상태/캐시 파일 직렬화에 사용, 없으면 표준 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Shared 모듈에서 import
 from .shared.cache_manager import cache_manager
 from .shared.llm_tracker import llm_tracker
@@ -26,6 +32,7 @@ from .shared.command_queue import command_queue
 from .shared.metrics import metrics
 from .shared.conversation_saver import conversation_saver
 from .shared.error_handler import error_handler, with_retry, ErrorSeverity
+from ...ws_utils import encode_message, decode_message, broadcast_text
 
 # 설정
 logger = logging.getLogger(__name__)
@@ -42,6 +49,24 @@ STATE_FILE_PATH = DATA_PATH / "system_state.json"
 SESSION_CACHE_PATH = DATA_PATH / "session_cache.json"
 EXTENSION_HEARTBEAT_PATH = DATA_PATH / "extension_heartbeat.json"
 
+def _write_json_file(path: Path, data: Any, indent: Optional[int] = 2):
+    """JSON 파일 쓰기 (async 코드에서는 asyncio.to_thread로 호출)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        # orjson은 bytes를 바로 반환하므로 별도 인코딩 없이 기록 (들여쓰기는 2칸만 지원)
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        path.write_bytes(orjson.dumps(data, option=option))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=indent)
+
+def _read_json_file(path: Path) -> Any:
+    """JSON 파일 읽기 (async 코드에서는 asyncio.to_thread로 호출)"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
 # ======================== Data Models ========================
 
 class MessageType(Enum):
@@ -103,9 +128,8 @@ class SystemStateManager:
         """Save state to file with retry"""
         async with self.state_lock:
             try:
-                STATE_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-                with open(STATE_FILE_PATH, 'w') as f:
-                    json.dump(self.state.dict(), f, indent=2)
+                # 파일 쓰기는 스레드에서 (이벤트 루프 블로킹 방지), 락으로 쓰기 순서 보장
+                await asyncio.to_thread(_write_json_file, STATE_FILE_PATH, self.state.dict())
             except Exception as e:
                 logger.error(f"Failed to save state: {e}")
                 raise
@@ -125,20 +149,14 @@ class SystemStateManager:
     async def broadcast_state(self):
         """Broadcast state to all connected WebSocket clients"""
         if active_websockets:
-            state_data = self.state.dict()
-            disconnected = set()
-            
-            for websocket in active_websockets:
-                try:
-                    await websocket.send_json({
-                        "type": "state_update",
-                        "data": state_data
-                    })
-                except:
-                    disconnected.add(websocket)
+            payload = encode_message({
+                "type": "state_update",
+                "data": self.state.dict()
+            })
+            failed = await broadcast_text([(ws, ws) for ws in active_websockets], payload)
                     
             # Remove disconnected websockets
-            for ws in disconnected:
+            for ws, _ in failed:
                 active_websockets.discard(ws)
 
 # Global state manager
@@ -223,10 +241,8 @@ class UnifiedSessionManager:
     async def save_cache(self):
         """Save session cache to file with retry"""
         try:
-            SESSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
             cache_data = {k: v.dict() for k, v in self.cache.items()}
-            with open(SESSION_CACHE_PATH, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            await asyncio.to_thread(_write_json_file, SESSION_CACHE_PATH, cache_data)
         except Exception as e:
             logger.error(f"Failed to save session cache: {e}")
             raise
@@ -237,13 +253,9 @@ class UnifiedSessionManager:
         expires_at = None
         if valid:
             if cookies:
-                max_expiry = None
-                for cookie in cookies:
-                    if cookie.get("expires"):
-                        expiry_time = datetime.fromtimestamp(cookie["expires"])
-                        if max_expiry is None or expiry_time > max_expiry:
-                            max_expiry = expiry_time
-                expires_at = max_expiry.isoformat() if max_expiry else (datetime.now() + timedelta(days=7)).isoformat()
+                # epoch 값으로 최대값을 구한 뒤 한 번만 datetime 변환
+                max_expiry = max((cookie["expires"] for cookie in cookies if cookie.get("expires")), default=None)
+                expires_at = datetime.fromtimestamp(max_expiry).isoformat() if max_expiry else (datetime.now() + timedelta(days=7)).isoformat()
             else:
                 expires_at = (datetime.now() + timedelta(days=7)).isoformat()
         
@@ -330,9 +342,8 @@ class ExtensionMonitor:
         """Check Extension heartbeat status"""
         try:
             if EXTENSION_HEARTBEAT_PATH.exists():
-                with open(EXTENSION_HEARTBEAT_PATH, 'r') as f:
-                    data = json.load(f)
-                    heartbeat = ExtensionHeartbeat(**data)
+                data = await asyncio.to_thread(_read_json_file, EXTENSION_HEARTBEAT_PATH)
+                heartbeat = ExtensionHeartbeat(**data)
                     
                 last_seen = datetime.fromisoformat(heartbeat.timestamp)
                 
@@ -350,9 +361,7 @@ class ExtensionMonitor:
     async def update_heartbeat(self, heartbeat: ExtensionHeartbeat):
         """Update heartbeat from Extension"""
         try:
-            EXTENSION_HEARTBEAT_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(EXTENSION_HEARTBEAT_PATH, 'w') as f:
-                json.dump(heartbeat.dict(), f)
+            await asyncio.to_thread(_write_json_file, EXTENSION_HEARTBEAT_PATH, heartbeat.dict(), None)
                 
             self.last_heartbeat = datetime.now()
             await state_manager.update_state("extension_status", "connected")
@@ -405,20 +414,21 @@ async def state_websocket(websocket: WebSocket):
     
     try:
         # Send current state
-        await websocket.send_json({
+        await websocket.send_text(encode_message({
             "type": "state_update",
             "data": state_manager.state.dict()
-        })
+        }))
         
         # Keep connection alive with ping/pong
+        ping_payload = encode_message({"type": "ping"})
         while True:
             try:
-                await websocket.send_json({"type": "ping"})
+                await websocket.send_text(ping_payload)
                 # 클라이언트 응답 대기 (타임아웃 설정)
-                pong_msg = await asyncio.wait_for(
-                    websocket.receive_json(), 
+                pong_msg = decode_message(await asyncio.wait_for(
+                    websocket.receive_text(), 
                     timeout=60  # 60초 타임아웃
-                )
+                ))
                 
                 # pong 메시지 확인
                 if pong_msg.get("type") != "pong":
@@ -462,6 +472,127 @@ async def complete_command_endpoint(command_id: str, result: Dict[str, Any]):
     
     return {"status": "completed"}
 
+async def _handle_init(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extension 초기화"""
+    await state_manager.update_state("extension_status", "connected")
+    await state_manager.update_state("firefox_status", "ready")
+    return {"status": "initialized"}
+
+async def _handle_heartbeat(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Heartbeat 처리"""
+    await extension_monitor.update_heartbeat(ExtensionHeartbeat(
+        timestamp=datetime.now().isoformat(),
+        status="active",
+        sessions=data.get('sessions', {})
+    ))
+    return {"status": "alive"}
+
+async def _handle_session_update(data: Dict[str, Any]) -> Dict[str, Any]:
+    """세션 업데이트"""
+    platform = data.get('platform')
+    valid = data.get('valid', False)
+    cookies = data.get('cookies', [])
+    
+    await session_manager.update_session(
+        platform=platform,
+        valid=valid,
+        cookies=cookies,
+        source="native"
+    )
+    return {"status": "updated"}
+
+async def _handle_collection_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """대화 수집 결과"""
+    platform = data.get('platform')
+    conversations = data.get('conversations', [])
+    excluded_ids = data.get('excluded_llm_ids', [])
+    command_id = data.get('command_id')
+    
+    # LLM 필터링
+    filtered = await llm_tracker.filter_conversations(conversations, platform)
+    
+    # 저장
+    if filtered["conversations"]:
+        save_response = await save_conversations_internal({
+            "platform": platform,
+            "conversations": filtered["conversations"],
+            "metadata": {
+                "source": "native_collection",
+                **filtered["filter_stats"]
+            }
+        })
+        
+        logger.info(f"Saved {len(filtered['conversations'])} conversations from {platform}")
+    
+    # 명령 완료
+    if command_id:
+        await native_command_manager.complete_command(command_id, {
+            "success": True,
+            "collected": len(filtered["conversations"]),
+            "excluded": filtered["excluded_count"]
+        })
+    
+    return {"status": "saved", "count": len(filtered["conversations"])}
+
+async def _handle_llm_query_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """LLM 질문 결과"""
+    conversation_id = data.get('conversation_id')
+    platform = data.get('platform')
+    query = data.get('query')
+    response_text = data.get('response')
+    command_id = data.get('command_id')
+    
+    # LLM 대화로 추적
+    await llm_tracker.track(conversation_id, platform, {
+        'query': query,
+        'source': 'llm_query',
+        'created_at': datetime.now().isoformat()
+    })
+    
+    # 명령 완료
+    if command_id:
+        await native_command_manager.complete_command(command_id, data)
+    
+    return {"status": "tracked", "conversation_id": conversation_id}
+
+async def _handle_crawl_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """웹 크롤링 결과"""
+    url = data.get('url')
+    content = data.get('content')
+    extracted = data.get('extracted_data', {})
+    command_id = data.get('command_id')
+    
+    # 명령 완료
+    if command_id:
+        await native_command_manager.complete_command(command_id, data)
+    
+    return {"status": "crawled", "url": url}
+
+async def _handle_native_error(data: Dict[str, Any]) -> Dict[str, Any]:
+    """에러 처리"""
+    error_msg = data.get('error', 'Unknown error')
+    command_id = data.get('command_id')
+    logger.error(f"Native error: {error_msg}")
+    
+    if command_id:
+        await native_command_manager.complete_command(command_id, {
+            "success": False,
+            "error": error_msg
+        })
+    
+    return {"status": "error", "message": error_msg}
+
+# 메시지 타입 -> 처리 함수 (if/elif 비교 대신 dict 조회 한 번으로 분기)
+NATIVE_MESSAGE_HANDLERS = {
+    MessageType.INIT.value: _handle_init,
+    MessageType.HEARTBEAT.value: _handle_heartbeat,
+    MessageType.SESSION_UPDATE.value: _handle_session_update,
+    MessageType.COLLECTION_RESULT.value: _handle_collection_result,
+    MessageType.LLM_QUERY_RESULT.value: _handle_llm_query_result,
+    MessageType.CRAWL_RESULT.value: _handle_crawl_result,
+    MessageType.ERROR.value: _handle_native_error,
+}
+
 # ======================== Native Message Handler ========================
 
 @router.post("/native/message")
@@ -478,121 +609,13 @@ async def handle_native_message(message: Dict[str, Any]):
     # 메트릭 기록
     await metrics.increment_counter(f"native_message.{msg_type}")
     
+    handler = NATIVE_MESSAGE_HANDLERS.get(msg_type)
+    if handler is None:
+        logger.warning(f"Unknown message type: {msg_type}")
+        return {"status": "unknown", "type": msg_type}
+    
     try:
-        if msg_type == MessageType.INIT.value:
-            # Extension 초기화
-            await state_manager.update_state("extension_status", "connected")
-            await state_manager.update_state("firefox_status", "ready")
-            return {"status": "initialized"}
-            
-        elif msg_type == MessageType.HEARTBEAT.value:
-            # Heartbeat 처리
-            await extension_monitor.update_heartbeat(ExtensionHeartbeat(
-                timestamp=datetime.now().isoformat(),
-                status="active",
-                sessions=data.get('sessions', {})
-            ))
-            return {"status": "alive"}
-            
-        elif msg_type == MessageType.SESSION_UPDATE.value:
-            # 세션 업데이트
-            platform = data.get('platform')
-            valid = data.get('valid', False)
-            cookies = data.get('cookies', [])
-            
-            await session_manager.update_session(
-                platform=platform,
-                valid=valid,
-                cookies=cookies,
-                source="native"
-            )
-            return {"status": "updated"}
-            
-        elif msg_type == MessageType.COLLECTION_RESULT.value:
-            # 대화 수집 결과
-            platform = data.get('platform')
-            conversations = data.get('conversations', [])
-            excluded_ids = data.get('excluded_llm_ids', [])
-            command_id = data.get('command_id')
-            
-            # LLM 필터링
-            filtered = await llm_tracker.filter_conversations(conversations, platform)
-            
-            # 저장
-            if filtered["conversations"]:
-                save_response = await save_conversations_internal({
-                    "platform": platform,
-                    "conversations": filtered["conversations"],
-                    "metadata": {
-                        "source": "native_collection",
-                        **filtered["filter_stats"]
-                    }
-                })
-                
-                logger.info(f"Saved {len(filtered['conversations'])} conversations from {platform}")
-            
-            # 명령 완료
-            if command_id:
-                await native_command_manager.complete_command(command_id, {
-                    "success": True,
-                    "collected": len(filtered["conversations"]),
-                    "excluded": filtered["excluded_count"]
-                })
-            
-            return {"status": "saved", "count": len(filtered["conversations"])}
-            
-        elif msg_type == MessageType.LLM_QUERY_RESULT.value:
-            # LLM 질문 결과
-            conversation_id = data.get('conversation_id')
-            platform = data.get('platform')
-            query = data.get('query')
-            response_text = data.get('response')
-            command_id = data.get('command_id')
-            
-            # LLM 대화로 추적
-            await llm_tracker.track(conversation_id, platform, {
-                'query': query,
-                'source': 'llm_query',
-                'created_at': datetime.now().isoformat()
-            })
-            
-            # 명령 완료
-            if command_id:
-                await native_command_manager.complete_command(command_id, data)
-            
-            return {"status": "tracked", "conversation_id": conversation_id}
-            
-        elif msg_type == MessageType.CRAWL_RESULT.value:
-            # 웹 크롤링 결과
-            url = data.get('url')
-            content = data.get('content')
-            extracted = data.get('extracted_data', {})
-            command_id = data.get('command_id')
-            
-            # 명령 완료
-            if command_id:
-                await native_command_manager.complete_command(command_id, data)
-            
-            return {"status": "crawled", "url": url}
-            
-        elif msg_type == MessageType.ERROR.value:
-            # 에러 처리
-            error_msg = data.get('error', 'Unknown error')
-            command_id = data.get('command_id')
-            logger.error(f"Native error: {error_msg}")
-            
-            if command_id:
-                await native_command_manager.complete_command(command_id, {
-                    "success": False,
-                    "error": error_msg
-                })
-            
-            return {"status": "error", "message": error_msg}
-            
-        else:
-            logger.warning(f"Unknown message type: {msg_type}")
-            return {"status": "unknown", "type": msg_type}
-            
+        return await handler(data)
     except Exception as e:
         logger.error(f"Native message handling error: {e}")
         await metrics.increment_counter("native_message.error")
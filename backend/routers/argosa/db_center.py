@@ -6,6 +6,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import uuid
 import asyncio
+import time
 
 router = APIRouter()
 
@@ -121,7 +122,7 @@ async def get_storage_stats():
 @router.post("/query")
 async def query_database(request: QueryRequest):
     """Query the database"""
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     results = []
     
@@ -140,7 +141,7 @@ async def query_database(request: QueryRequest):
             "vector": vector_results
         }
     
-    execution_time = (datetime.now() - start_time).total_seconds() * 1000  # ms
+    execution_time = (time.perf_counter() - start_time) * 1000  # ms
     
     # Update stats
     storage_stats.queries += 1
@@ -256,9 +257,10 @@ async def perform_sync():
     await asyncio.sleep(5)  # Simulate sync time
     
     # Update all collections back to active
+    now_iso = datetime.now().isoformat()
     for collection in collections.values():
         collection.status = "active"
-        collection.lastUpdated = datetime.now().isoformat()
+        collection.lastUpdated = now_iso
 
 # ===== Initialize/Shutdown =====
 async def initialize():
@@ -266,6 +268,7 @@ async def initialize():
     print("[DB Center] Initializing database management system...")
     
     # Create sample collections
+    now_iso = datetime.now().isoformat()
     sample_collections = [
         DBCollection(
             id="col_analysis",
@@ -273,7 +276,7 @@ async def initialize():
             type="vector",
             size=int(1.2 * 1024 * 1024 * 1024),  # int()로 변환
             documents=15420,
-            lastUpdated=datetime.now().isoformat(),
+            lastUpdated=now_iso,
             status="active"
         ),
         DBCollection(
@@ -282,7 +285,7 @@ async def initialize():
             type="neo4j",
             size=800 * 1024 * 1024,  # 이미 int
             documents=8930,
-            lastUpdated=datetime.now().isoformat(),
+            lastUpdated=now_iso,
             status="active"
         ),
         DBCollection(
@@ -291,7 +294,7 @@ async def initialize():
             type="hybrid",
             size=450 * 1024 * 1024,  # 이미 int
             documents=3256,
-            lastUpdated=datetime.now().isoformat(),
+            lastUpdated=now_iso,
             status="active"
         )
     ]
@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Any, Optional
+from collections import defaultdict
 from ...services.rag_service import rag_service, module_integration, RAGQuery
 
 router = APIRouter()
@@ -141,14 +142,9 @@ async def get_workflow_context(session_id: str):
     result = await rag_service.search(rag_query)
     
     # Organize by module and type
-    context_map = {}
+    context_map = defaultdict(lambda: defaultdict(list))
     for doc in result.documents:
         if doc.metadata.get("session_id") == session_id:
-            if doc.module not in context_map:
-                context_map[doc.module] = {}
-            if doc.type not in context_map[doc.module]:
-                context_map[doc.module][doc.type] = []
-            
             context_map[doc.module][doc.type].append({
                 "content": doc.content[:200] + "...",
                 "created_at": doc.created_at,
@@ -157,7 +153,7 @@ async def get_workflow_context(session_id: str):
     
     return {
         "session_id": session_id,
-        "context_map": context_map,
+        "context_map": {module: dict(types) for module, types in context_map.items()},
         "total_documents": len(result.documents),
         "modules_involved": list(context_map.keys())
     }
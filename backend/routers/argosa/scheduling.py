@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from collections import defaultdict
 import uuid
 
 router = APIRouter()
@@ -126,10 +127,8 @@ async def optimize_schedule(schedule_id: str):
     schedule = schedules[schedule_id]
     
     # Simple optimization: Check for conflicts and adjust dates
-    tasks_by_assignee = {}
+    tasks_by_assignee = defaultdict(list)
     for task in schedule.tasks:
-        if task.assignee not in tasks_by_assignee:
-            tasks_by_assignee[task.assignee] = []
         tasks_by_assignee[task.assignee].append(task)
     
     # Detect and resolve conflicts
@@ -155,10 +154,18 @@ async def optimize_schedule(schedule_id: str):
 async def get_workload(assignee: str):
     """Get workload analysis for an assignee"""
     assignee_tasks = []
+    # 워크로드 지표는 작업을 모으는 같은 루프에서 함께 집계
+    active_tasks = pending_tasks = high_priority = 0
     
     for schedule in schedules.values():
         for task in schedule.tasks:
             if task.assignee == assignee:
+                if task.status == "in-progress":
+                    active_tasks += 1
+                elif task.status == "pending":
+                    pending_tasks += 1
+                if task.priority == "high":
+                    high_priority += 1
                 assignee_tasks.append({
                     "task": task.name,
                     "schedule": schedule.name,
@@ -168,11 +175,6 @@ async def get_workload(assignee: str):
                     "priority": task.priority
                 })
     
-    # Calculate workload metrics
-    active_tasks = len([t for t in assignee_tasks if t["status"] == "in-progress"])
-    pending_tasks = len([t for t in assignee_tasks if t["status"] == "pending"])
-    high_priority = len([t for t in assignee_tasks if t["priority"] == "high"])
-    
     return {
         "assignee": assignee,
         "total_tasks": len(assignee_tasks),
@@ -207,6 +209,7 @@ async def initialize():
     print("[Scheduling] Initializing scheduling system...")
     
     # Create sample schedules
+    now = datetime.now()
     argosa_schedule = Schedule(
         id="argosa_main",
         name="Argosa System",
@@ -217,8 +220,8 @@ async def initialize():
             Task(
                 id="task_001",
                 name="LangGraph Integration Phase 1",
-                startDate=datetime.now().isoformat(),
-                endDate=(datetime.now() + timedelta(days=14)).isoformat(),
+                startDate=now.isoformat(),
+                endDate=(now + timedelta(days=14)).isoformat(),
                 progress=30,
                 assignee="AI Team",
                 priority="high",
@@ -228,8 +231,8 @@ async def initialize():
             Task(
                 id="task_002",
                 name="Data Pipeline Optimization",
-                startDate=(datetime.now() + timedelta(days=7)).isoformat(),
-                endDate=(datetime.now() + timedelta(days=21)).isoformat(),
+                startDate=(now + timedelta(days=7)).isoformat(),
+                endDate=(now + timedelta(days=21)).isoformat(),
                 progress=0,
                 assignee="Data Team",
                 dependencies=["task_001"],
@@ -45,8 +45,9 @@ class CacheManager:
         
         # 로컬 캐시 먼저 확인
         async with self._lock:
-            if cache_key in self._local_cache:
-                value, expires_at = self._local_cache[cache_key]
+            entry = self._local_cache.get(cache_key)
+            if entry is not None:
+                value, expires_at = entry
                 if datetime.now(timezone.utc) < expires_at:
                     return value
                 else:
@@ -10,6 +10,7 @@ from enum import IntEnum
 from pathlib import Path
 import logging
 from dataclasses import dataclass, asdict
+from collections import deque
 import heapq
 
 logger = logging.getLogger(__name__)
@@ -71,7 +72,7 @@ class ImprovedCommandQueue:
             "total_processed": 0,
             "total_failed": 0,
             "total_timeout": 0,
-            "processing_times": []
+            "processing_times": deque(maxlen=100)  # 최근 100개만 유지
         }
     
     async def initialize(self):
@@ -292,8 +293,6 @@ class ImprovedCommandQueue:
                 # 처리 시간 기록
                 processing_time = (command.completed_at - command.started_at).total_seconds()
                 self._stats["processing_times"].append(processing_time)
-                if len(self._stats["processing_times"]) > 100:
-                    self._stats["processing_times"] = self._stats["processing_times"][-100:]
                 
                 self._stats["total_processed"] += 1
                 
@@ -375,7 +374,7 @@ class ImprovedCommandQueue:
             state = {
                 'queue': [self._command_to_dict(cmd) for cmd in self._queue],
                 'processing': {k: self._command_to_dict(v) for k, v in self._processing.items()},
-                'stats': self._stats,
+                'stats': {**self._stats, 'processing_times': list(self._stats['processing_times'])},
                 'saved_at': datetime.now(timezone.utc).isoformat()
             }
             
@@ -404,8 +403,11 @@ class ImprovedCommandQueue:
                         cmd = self._dict_to_command(cmd_data)
                         heapq.heappush(self._queue, cmd)
                 
-                # 통계 복원
-                self._stats.update(state.get('stats', {}))
+                # 통계 복원 (처리 시간은 deque에 채워 넣어 최대 길이 유지)
+                stats = state.get('stats', {})
+                processing_times = stats.pop('processing_times', [])
+                self._stats.update(stats)
+                self._stats['processing_times'].extend(processing_times)
                 
                 logger.info(f"Loaded {len(self._queue)} pending commands from state")
                 
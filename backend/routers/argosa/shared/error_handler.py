@@ -4,7 +4,8 @@
 
 import asyncio
 import logging
-from typing import Callable, Any, Optional, Dict, Type
+from typing import Callable, Any, Optional, Dict, List, Type, Deque
+from collections import deque
 from datetime import datetime, timezone
 from functools import wraps
 import traceback
@@ -12,6 +13,9 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# 컨텍스트별로 유지할 최대 에러 기록 수
+ERROR_HISTORY_LIMIT = 100
+
 class ErrorSeverity(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -28,7 +32,7 @@ class ErrorHandler:
     """중앙 에러 처리 시스템"""
     
     def __init__(self):
-        self.error_history: Dict[str, List[Dict[str, Any]]] = {}
+        self.error_history: Dict[str, Deque[Dict[str, Any]]] = {}
         self.circuit_breakers: Dict[str, Dict[str, Any]] = {}
         self.recovery_strategies: Dict[Type[Exception], RecoveryStrategy] = {
             asyncio.TimeoutError: RecoveryStrategy.RETRY,
@@ -143,7 +147,8 @@ class ErrorHandler:
         """에러 기록"""
         async with self._lock:
             if context not in self.error_history:
-                self.error_history[context] = []
+                # maxlen을 넘으면 가장 오래된 기록이 자동으로 제거됨
+                self.error_history[context] = deque(maxlen=ERROR_HISTORY_LIMIT)
             
             error_record = {
                 'timestamp': datetime.now(timezone.utc).isoformat(),
@@ -155,10 +160,6 @@ class ErrorHandler:
             }
             
             self.error_history[context].append(error_record)
-            
-            # 최대 100개만 유지
-            if len(self.error_history[context]) > 100:
-                self.error_history[context] = self.error_history[context][-100:]
     
     async def _is_circuit_open(self, context: str) -> bool:
         """Circuit breaker 상태 확인"""
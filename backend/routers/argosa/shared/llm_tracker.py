@@ -4,12 +4,16 @@
 import asyncio
 from typing import Set, Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
+from collections import Counter
 import logging
 import json
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 저널 기록이 이 수를 넘으면 전체 스냅샷으로 압축
+JOURNAL_COMPACT_THRESHOLD = 500
+
 class LLMTracker:
     """중앙 집중식 LLM 대화 추적"""
     
@@ -18,7 +22,14 @@ class LLMTracker:
         self._metadata: Dict[str, Dict[str, Any]] = {}
         self._platform_stats: Dict[str, int] = {}
         self._lock = asyncio.Lock()
+        self._io_lock = asyncio.Lock()  # 스냅샷/저널 파일 쓰기 직렬화
         self._persistence_file = Path("./data/argosa/llm_tracking.json")
+        # 마지막 스냅샷 이후 추가된 추적 기록 (append-only JSONL)
+        self._journal_file = self._persistence_file.with_suffix('.jsonl')
+        self._journal_lines = 0
+        # 저널에 쓸 대기 기록과 이를 비우는 단일 백그라운드 태스크 (기록마다 태스크를 만들지 않음)
+        self._pending_records: List[Dict[str, Any]] = []
+        self._journal_task: Optional[asyncio.Task] = None
         self._load_state()
     
     def _load_state(self):
@@ -30,13 +41,67 @@ class LLMTracker:
                     self._tracked_ids = set(data.get('tracked_ids', []))
                     self._metadata = data.get('metadata', {})
                     self._platform_stats = data.get('platform_stats', {})
-                    logger.info(f"Loaded {len(self._tracked_ids)} tracked LLM conversations")
+            
+            # 스냅샷 이후 저널 재생
+            if self._journal_file.exists():
+                with open(self._journal_file, 'r') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # 쓰다 끊긴 마지막 줄
+                        self._apply_record(record)
+                        self._journal_lines += 1
+            
+            if self._tracked_ids:
+                logger.info(f"Loaded {len(self._tracked_ids)} tracked LLM conversations")
         except Exception as e:
             logger.error(f"Failed to load LLM tracking state: {e}")
     
+    def _apply_record(self, record: Dict[str, Any]):
+        """저널 기록 하나를 메모리 상태에 반영 (이미 추적 중인 ID는 무시)"""
+        conv_id = record['id']
+        if conv_id in self._tracked_ids:
+            return
+        
+        self._tracked_ids.add(conv_id)
+        self._metadata[conv_id] = record.get('metadata', {})
+        
+        platform = record.get('counted_platform')
+        if platform:
+            self._platform_stats[platform] = self._platform_stats.get(platform, 0) + 1
+    
+    async def _append_journal(self, records: List[Dict[str, Any]]):
+        """새 추적 기록을 저널 끝에 추가 (전체 상태를 다시 쓰지 않음)"""
+        async with self._io_lock:
+            try:
+                self._journal_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._journal_file, 'a') as f:
+                    f.write(''.join(json.dumps(record) + '\n' for record in records))
+                self._journal_lines += len(records)
+            except Exception as e:
+                logger.error(f"Failed to append LLM tracking journal: {e}")
+        
+        if self._journal_lines >= JOURNAL_COMPACT_THRESHOLD:
+            await self._save_state()
+    
+    def _queue_journal(self, records: List[Dict[str, Any]]):
+        """저널 기록을 대기열에 넣고, 실행 중인 writer가 없을 때만 하나 시작"""
+        self._pending_records.extend(records)
+        if self._journal_task is None or self._journal_task.done():
+            self._journal_task = asyncio.create_task(self._drain_journal())
+    
+    async def _drain_journal(self):
+        """대기 중인 기록을 모아서 저널에 추가 (쓰는 동안 쌓인 기록은 다음 묶음으로)"""
+        while self._pending_records:
+            records, self._pending_records = self._pending_records, []
+            await self._append_journal(records)
+    
     async def _save_state(self):
-        """상태 저장"""
-        async with self._lock:
+        """전체 상태 스냅샷 저장 후 저널 비우기"""
+        async with self._io_lock, self._lock:
             try:
                 self._persistence_file.parent.mkdir(parents=True, exist_ok=True)
                 data = {
@@ -54,6 +119,10 @@ class LLMTracker:
                 # 원자적 교체
                 temp_file.replace(self._persistence_file)
                 
+                # 스냅샷에 모두 반영되었으므로 저널 제거
+                self._journal_file.unlink(missing_ok=True)
+                self._journal_lines = 0
+                
             except Exception as e:
                 logger.error(f"Failed to save LLM tracking state: {e}")
     
@@ -76,10 +145,16 @@ class LLMTracker:
             # 플랫폼별 통계 업데이트
             self._platform_stats[platform] = self._platform_stats.get(platform, 0) + 1
             
+            record = {
+                'id': conversation_id,
+                'metadata': self._metadata[conversation_id],
+                'counted_platform': platform
+            }
+            
             logger.info(f"Tracked LLM conversation: {conversation_id} on {platform}")
         
-        # 비동기 저장
-        asyncio.create_task(self._save_state())
+        # 비동기 저장 (저널에 한 줄 추가)
+        self._queue_journal([record])
         return True
     
     async def is_tracked(self, conversation_id: str) -> bool:
@@ -103,6 +178,7 @@ class LLMTracker:
         filtered = []
         excluded_ids = []
         excluded_metadata = []
+        new_records = []
         
         async with self._lock:
             for conv in conversations:
@@ -128,12 +204,13 @@ class LLMTracker:
                             'source': 'discovered',
                             **conv_metadata
                         }
+                        new_records.append({'id': conv_id, 'metadata': self._metadata[conv_id]})
                 else:
                     filtered.append(conv)
         
-        # 비동기 저장
-        if excluded_ids:
-            asyncio.create_task(self._save_state())
+        # 비동기 저장 (새로 발견된 대화만 저널에 추가)
+        if new_records:
+            self._queue_journal(new_records)
         
         return {
             'conversations': filtered,
@@ -152,26 +229,24 @@ class LLMTracker:
             total_tracked = len(self._tracked_ids)
             
             # 시간별 통계
-            time_stats = {}
-            for meta in self._metadata.values():
-                tracked_date = meta.get('tracked_at', '').split('T')[0]
-                if tracked_date:
-                    time_stats[tracked_date] = time_stats.get(tracked_date, 0) + 1
+            time_stats = Counter(
+                tracked_date
+                for tracked_date in (
+                    meta.get('tracked_at', '').split('T', 1)[0] for meta in self._metadata.values()
+                )
+                if tracked_date
+            )
             
             return {
                 'total_tracked': total_tracked,
                 'platform_breakdown': dict(self._platform_stats),
-                'daily_tracking': time_stats,
+                'daily_tracking': dict(time_stats),
                 'sources': self._count_sources()
             }
     
     def _count_sources(self) -> Dict[str, int]:
         """소스별 카운트"""
-        sources = {}
-        for meta in self._metadata.values():
-            source = meta.get('source', 'unknown')
-            sources[source] = sources.get(source, 0) + 1
-        return sources
+        return dict(Counter(meta.get('source', 'unknown') for meta in self._metadata.values()))
     
     async def cleanup_old_tracking(self, days: int = 30):
         """오래된 추적 정보 정리"""
@@ -19,9 +19,13 @@ class MetricsCollector:
         self.gauges: Dict[str, float] = {}
         self._lock = asyncio.Lock()
         self._collection_task: Optional[asyncio.Task] = None
+        self._process = psutil.Process()
     
     async def initialize(self):
         """메트릭 수집 시작"""
+        # CPU 사용률 기준점 설정 - 이후 interval=None 호출은 직전 호출 이후의 평균을 바로 반환
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
         self._collection_task = asyncio.create_task(self._collect_system_metrics())
         logger.info("Metrics collector initialized")
     
@@ -62,8 +66,8 @@ class MetricsCollector:
         """시스템 메트릭 주기적 수집"""
         while True:
             try:
-                # CPU 사용률
-                cpu_percent = psutil.cpu_percent(interval=1)
+                # CPU 사용률 (직전 수집 이후 평균, 이벤트 루프를 블로킹하지 않음)
+                cpu_percent = psutil.cpu_percent(interval=None)
                 await self.set_gauge("system.cpu_percent", cpu_percent)
                 
                 # 메모리 사용률
@@ -76,8 +80,8 @@ class MetricsCollector:
                 await self.set_gauge("system.disk_percent", disk.percent)
                 
                 # 프로세스 정보
-                process = psutil.Process()
-                await self.set_gauge("process.cpu_percent", process.cpu_percent())
+                process = self._process
+                await self.set_gauge("process.cpu_percent", process.cpu_percent(interval=None))
                 await self.set_gauge("process.memory_mb", process.memory_info().rss / 1024 / 1024)
                 await self.set_gauge("process.threads", process.num_threads())
                 
@@ -2,12 +2,14 @@
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 import uuid
 import asyncio
 import json
 
+from ...ws_utils import encode_message, broadcast_text
+
 router = APIRouter()
 
 # ===== Data Models =====
@@ -46,7 +48,7 @@ class SystemStatus(BaseModel):
 # In-memory storage
 confirmations: Dict[str, UserConfirmation] = {}
 messages: List[UserMessage] = []
-active_websockets: List[WebSocket] = []
+active_websockets: Set[WebSocket] = set()
 system_statuses: Dict[str, SystemStatus] = {}
 
 # ===== API Endpoints =====
@@ -130,14 +132,14 @@ async def get_messages(limit: int = 50):
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
     await websocket.accept()
-    active_websockets.append(websocket)
+    active_websockets.add(websocket)
     
     try:
         # Send initial status
-        await websocket.send_json({
+        await websocket.send_text(encode_message({
             "type": "connection_established",
             "timestamp": datetime.now().isoformat()
-        })
+        }))
         
         # Keep connection alive
         while True:
@@ -146,7 +148,7 @@ async def websocket_endpoint(websocket: WebSocket):
             await websocket.send_text(f"Echo: {data}")
             
     except WebSocketDisconnect:
-        active_websockets.remove(websocket)
+        active_websockets.discard(websocket)
 
 @router.get("/system/status")
 async def get_system_status():
@@ -191,17 +193,15 @@ async def generate_ai_response(user_message: str) -> str:
 
 async def broadcast_update(update: Dict[str, Any]):
     """Broadcast update to all connected WebSocket clients"""
-    disconnected = []
+    if not active_websockets:
+        return
     
-    for websocket in active_websockets:
-        try:
-            await websocket.send_json(update)
-        except:
-            disconnected.append(websocket)
+    payload = encode_message(update)
+    failed = await broadcast_text([(ws, ws) for ws in active_websockets], payload)
     
     # Remove disconnected websockets
-    for ws in disconnected:
-        active_websockets.remove(ws)
+    for ws, _ in failed:
+        active_websockets.discard(ws)
 
 async def trigger_deployment(confirmation: UserConfirmation):
     """Trigger deployment process"""
@@ -340,7 +340,7 @@ async def shutdown():
     print("[User Input] Shutting down user input system...")
     
     # Close all websocket connections
-    for ws in active_websockets:
+    for ws in list(active_websockets):
         try:
             await ws.close()
         except:
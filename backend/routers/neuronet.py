@@ -4,9 +4,16 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Up
 from typing import Dict, List, Optional
 import asyncio
 import json
+from collections import Counter
 from datetime import datetime
 from pydantic import BaseModel
 import os
+import shutil
+
+from ws_utils import encode_message, broadcast_text, now_iso
+
+# 업로드 파일을 디스크로 옮길 때 사용하는 청크 크기 (메모리 사용량을 파일 크기와 무관하게 유지)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 # Create router
 router = APIRouter()
@@ -131,9 +138,11 @@ async def monitor_system():
     while True:
         try:
             # Update system metrics (mock data for now)
-            system_metrics["active_jobs"] = len([j for j in training_jobs.values() if j.status == 'training'])
+            # 작업 상태는 한 번만 순회해 집계
+            status_counts = Counter(j.status for j in training_jobs.values())
+            system_metrics["active_jobs"] = status_counts['training']
             system_metrics["total_datasets"] = len(datasets)
-            system_metrics["total_models"] = len([j for j in training_jobs.values() if j.status == 'completed'])
+            system_metrics["total_models"] = status_counts['completed']
             
             # Broadcast metrics to connected clients
             await broadcast_metrics()
@@ -145,22 +154,21 @@ async def monitor_system():
 
 async def broadcast_metrics():
     """Broadcast system metrics to all connected clients"""
+    if not active_connections:
+        return
+    
     message = {
         "type": "system_metrics",
         "data": system_metrics,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
+    payload = encode_message(message)
     
-    disconnected = []
-    for client_id, ws in active_connections.items():
-        try:
-            await ws.send_json(message)
-        except:
-            disconnected.append(client_id)
+    failed = await broadcast_text(active_connections.items(), payload)
     
     # Clean up disconnected clients
-    for client_id in disconnected:
-        del active_connections[client_id]
+    for client_id, _ in failed:
+        active_connections.pop(client_id, None)
 
 # WebSocket endpoint
 @router.websocket("/ws/{client_id}")
@@ -169,11 +177,11 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     active_connections[client_id] = websocket
     
     # Send initial metrics
-    await websocket.send_json({
+    await websocket.send_text(encode_message({
         "type": "system_metrics",
         "data": system_metrics,
-        "timestamp": datetime.now().isoformat()
-    })
+        "timestamp": now_iso()
+    }))
     
     try:
         while True:
@@ -181,7 +189,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             # Handle messages if needed
             
     except WebSocketDisconnect:
-        del active_connections[client_id]
+        active_connections.pop(client_id, None)
 
 # Dataset endpoints
 @router.get("/datasets")
@@ -200,9 +208,13 @@ async def upload_dataset(file: UploadFile = File(...)):
     file_path = f"data/neuronet/datasets/{file.filename}"
     
     try:
-        content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(content)
+        # 전체 내용을 메모리에 올리지 않고 청크 단위로 복사 (스레드에서 실행해 이벤트 루프 블로킹 방지)
+        def save_upload() -> int:
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(file.file, f, UPLOAD_CHUNK_SIZE)
+                return f.tell()
+        
+        size_bytes = await asyncio.to_thread(save_upload)
         
         # Create dataset entry
         dataset = Dataset(
@@ -210,7 +222,7 @@ async def upload_dataset(file: UploadFile = File(...)):
             name=file.filename,
             source="upload",
             format=file.filename.split('.')[-1],
-            size_mb=len(content) / (1024 * 1024),
+            size_mb=size_bytes / (1024 * 1024),
             record_count=0,  # To be determined after processing
             created_at=datetime.now()
         )
@@ -307,7 +319,7 @@ async def get_training_jobs():
     return {
         "jobs": list(training_jobs.values()),
         "total": len(training_jobs),
-        "active": len([j for j in training_jobs.values() if j.status == 'training'])
+        "active": sum(1 for j in training_jobs.values() if j.status == 'training')
     }
 
 @router.post("/training")
@@ -352,20 +364,20 @@ async def train_model(job: TrainingJob):
 
 async def broadcast_training_progress(job: TrainingJob):
     """Broadcast training progress to connected clients"""
+    if not active_connections:
+        return
+    
     message = {
         "type": "training_progress",
         "job_id": job.id,
         "epoch": job.current_epoch,
         "total_epochs": job.epochs,
         "metrics": job.metrics,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
+    payload = encode_message(message)
     
-    for ws in active_connections.values():
-        try:
-            await ws.send_json(message)
-        except:
-            pass
+    await broadcast_text(active_connections.items(), payload)
 
 # Labeling endpoints
 @router.get("/labeling")
@@ -476,12 +488,13 @@ async def deploy_model(model_id: str, request: dict):
 @router.get("/status")
 async def get_system_status():
     """Get NeuroNet system status"""
+    status_counts = Counter(j.status for j in training_jobs.values())
     return {
         "status": "development",
         "metrics": system_metrics,
         "datasets": len(datasets),
-        "active_training": len([j for j in training_jobs.values() if j.status == 'training']),
-        "completed_models": len([j for j in training_jobs.values() if j.status == 'completed']),
+        "active_training": status_counts['training'],
+        "completed_models": status_counts['completed'],
         "active_connections": len(active_connections),
         "message": "NeuroNet system is under development"
     }
@@ -1,7 +1,7 @@
 # backend/routers/oneai.py - One AI 시스템 라우터
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Body
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 import asyncio
 import json
 import os
@@ -16,8 +16,9 @@ import traceback
 # Local imports
 from models import Section, Node, ExecuteRequest, Position, SectionConfig, OutputConfig
 from storage import save_node_data, sections_db
-from execution import execute_python_code, get_connected_outputs
+from execution import execute_python_code, get_connected_outputs, interpreter_pool
 from constants import GROUPS
+from ws_utils import encode_message, decode_message
 
 # Create router
 router = APIRouter()
@@ -26,9 +27,19 @@ router = APIRouter()
 active_connections: Dict[str, WebSocket] = {}
 connection_tasks: Dict[str, asyncio.Task] = {}
 
+# 클라이언트별 송신 큐와 전송 전담 writer 태스크 (소켓당 writer는 하나만 존재)
+OUTBOUND_QUEUE_SIZE = 1024
+outbound_queues: Dict[str, asyncio.Queue] = {}
+writer_tasks: Dict[str, asyncio.Task] = {}
+# 브로드캐스트용 (클라이언트 ID, 송신 큐) 스냅샷 (연결/해제 시에만 재생성)
+_client_snapshot: Tuple[Tuple[str, asyncio.Queue], ...] = ()
+
 # Data file for One AI sections
 SECTIONS_DATA_FILE = "data/oneai_sections_data.json"
 
+# data URL로 반환할 수 있는 이미지 확장자
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg'})
+
 # State management
 has_changes = False
 has_changes_lock = asyncio.Lock()
@@ -244,6 +255,9 @@ async def shutdown():
         except:
             pass
     
+    # Stop prewarmed code execution interpreters
+    await interpreter_pool.shutdown()
+    
     print("[OneAI] Shut down successfully")
 
 async def periodic_save():
@@ -302,35 +316,105 @@ async def periodic_save():
     
     print("[OneAI] Periodic save task ended")
 
+def _refresh_client_snapshot():
+    """브로드캐스트 대상 클라이언트 스냅샷 재생성"""
+    global _client_snapshot
+    _client_snapshot = tuple(outbound_queues.items())
+
+def _cleanup_client(client_id: str, websocket: Optional[WebSocket] = None):
+    """클라이언트 연결 정보와 관련 태스크 정리
+
+    websocket을 주면 그 연결이 아직 등록된 연결일 때만 정리한다
+    (같은 client_id로 재접속한 새 연결의 큐/태스크를 건드리지 않도록).
+    """
+    if websocket is not None and active_connections.get(client_id) is not websocket:
+        return
+    active_connections.pop(client_id, None)
+    if outbound_queues.pop(client_id, None) is not None:
+        _refresh_client_snapshot()
+    for tasks in (connection_tasks, writer_tasks):
+        task = tasks.pop(client_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+async def _writer_loop(client_id: str, websocket: WebSocket, queue: asyncio.Queue):
+    """송신 큐에 쌓인 (이미 인코딩된) 메시지를 순서대로 전송"""
+    # 메시지마다 속성 조회를 하지 않도록 메서드를 미리 바인딩
+    get = queue.get
+    send = websocket.send_text
+    try:
+        while True:
+            await send(await get())
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        print(f"[OneAI] Failed to send to {client_id}: {e}")
+        _cleanup_client(client_id, websocket)
+
+def _enqueue(queue: asyncio.Queue, payload: str) -> bool:
+    """송신 큐에 메시지 넣기 (큐가 가득 차면 False)"""
+    try:
+        queue.put_nowait(payload)
+        return True
+    except asyncio.QueueFull:
+        return False
+
+def send_to_client(client_id: str, payload: str) -> bool:
+    """인코딩된 메시지를 클라이언트 송신 큐에 넣기 (연결이 없거나 큐가 가득 차면 False)"""
+    queue = outbound_queues.get(client_id)
+    if queue is None:
+        return False
+    return _enqueue(queue, payload)
+
 async def broadcast_message(message: dict):
     """Broadcast message to all connected clients"""
-    disconnected = []
-    for client_id, ws in active_connections.items():
-        try:
-            await ws.send_json(message)
-        except Exception as e:
-            print(f"[OneAI] Failed to send to {client_id}: {e}")
-            disconnected.append(client_id)
+    await broadcast_messages([message])
+
+async def broadcast_messages(messages: List[dict]):
+    """여러 메시지를 한 번에 인코딩해 클라이언트마다 한 번의 순회로 큐에 넣기 (프레임은 메시지별 유지)"""
+    if not _client_snapshot:
+        return
     
-    # Clean up disconnected clients
-    for client_id in disconnected:
-        if client_id in active_connections:
-            del active_connections[client_id]
-        if client_id in connection_tasks:
-            connection_tasks[client_id].cancel()
-            del connection_tasks[client_id]
+    payloads = [encode_message(message) for message in messages]
+    slow_clients = [
+        client_id for client_id, queue in _client_snapshot
+        if not all(_enqueue(queue, payload) for payload in payloads)
+    ]
+    
+    # 송신 큐가 가득 찬 느린 클라이언트는 연결 해제
+    for client_id in slow_clients:
+        print(f"[OneAI] Outbound queue full for {client_id}, disconnecting")
+        ws = active_connections.get(client_id)
+        _cleanup_client(client_id)
+        if ws is not None:
+            try:
+                await ws.close(code=1013)
+            except Exception:
+                pass
+
+_PING_PAYLOAD = encode_message({"type": "ping"})
+_HEARTBEAT_ACK_PAYLOAD = encode_message({"type": "heartbeat_ack"})
 
 # WebSocket endpoint
 @router.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     await websocket.accept()
+    
+    # 같은 client_id의 이전 연결이 남아 있으면 그 writer/heartbeat 태스크와 큐를 먼저 정리
+    if client_id in active_connections:
+        _cleanup_client(client_id)
     active_connections[client_id] = websocket
     
+    queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+    outbound_queues[client_id] = queue
+    _refresh_client_snapshot()
+    writer_tasks[client_id] = asyncio.create_task(_writer_loop(client_id, websocket, queue))
+    
     # Heartbeat task
     async def heartbeat():
         try:
-            while client_id in active_connections:
-                await websocket.send_json({"type": "ping"})
+            while active_connections.get(client_id) is websocket:
+                _enqueue(queue, _PING_PAYLOAD)
                 await asyncio.sleep(30)
         except:
             pass
@@ -346,9 +430,9 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             
             # Handle other messages
             try:
-                data = json.loads(message)
+                data = decode_message(message)
                 if data.get("type") == "heartbeat":
-                    await websocket.send_json({"type": "heartbeat_ack"})
+                    _enqueue(queue, _HEARTBEAT_ACK_PAYLOAD)
             except:
                 pass
                 
@@ -357,11 +441,8 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     except Exception as e:
         print(f"[OneAI] Error with client {client_id}: {e}")
     finally:
-        if client_id in active_connections:
-            del active_connections[client_id]
-        if client_id in connection_tasks:
-            connection_tasks[client_id].cancel()
-            del connection_tasks[client_id]
+        # 같은 client_id로 재접속한 연결은 건드리지 않음
+        _cleanup_client(client_id, websocket)
 
 # Legacy WebSocket endpoint for compatibility
 @router.websocket("/ws")
@@ -492,31 +573,36 @@ async def get_project_files(project_id: str):
             os.makedirs(project_path, exist_ok=True)
             return {"files": []}
         
-        def scan_directory(path: Path, base_path: Path) -> List[FileNode]:
+        def scan_directory(path: str, base_path: str) -> List[FileNode]:
             items = []
             try:
-                for item in sorted(path.iterdir()):
-                    if item.name.startswith('.') or item.name in ['__pycache__', 'node_modules', 'venv']:
+                # os.scandir: DirEntry가 타입/stat 정보를 캐시하므로 항목당 stat 호출 1회
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+                
+                for entry in entries:
+                    if entry.name.startswith('.') or entry.name in ['__pycache__', 'node_modules', 'venv']:
                         continue
                     
                     try:
-                        relative_path = item.relative_to(base_path)
+                        is_dir = entry.is_dir()
+                        relative_path = os.path.relpath(entry.path, base_path)
                         file_node = FileNode(
-                            name=item.name,
-                            path=str(relative_path).replace('\\', '/'),
-                            type='directory' if item.is_dir() else 'file'
+                            name=entry.name,
+                            path=relative_path.replace('\\', '/'),
+                            type='directory' if is_dir else 'file'
                         )
                         
-                        if item.is_file():
-                            stat = item.stat()
+                        if is_dir:
+                            file_node.children = scan_directory(entry.path, base_path)
+                        elif entry.is_file():
+                            stat = entry.stat()
                             file_node.size = stat.st_size
                             file_node.modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
-                        elif item.is_dir():
-                            file_node.children = scan_directory(item, base_path)
                         
                         items.append(file_node)
                     except Exception as e:
-                        print(f"Error processing {item}: {e}")
+                        print(f"Error processing {entry.path}: {e}")
                         continue
                         
             except PermissionError as e:
@@ -526,7 +612,7 @@ async def get_project_files(project_id: str):
             
             return items
         
-        files = scan_directory(Path(project_path), Path(project_path))
+        files = scan_directory(project_path, project_path)
         return {"files": files}
         
     except Exception as e:
@@ -568,7 +654,7 @@ async def get_file_content(project_id: str, file_path: str = Body(..., embed=Tru
             # Handle binary files
             try:
                 ext = os.path.splitext(full_path)[1].lower()
-                if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg']:
+                if ext in IMAGE_EXTENSIONS:
                     import base64
                     with open(full_path, 'rb') as f:
                         binary_content = f.read()
@@ -686,45 +772,48 @@ async def execute_node_task(request: ExecuteRequest, node: Node, section: Sectio
         
         print(f"[OneAI] Execution result: success={result.get('success')}, has_output={result.get('output') is not None}")
         
-        # Process execution logs
+        # Process execution logs (모아서 한 번에 브로드캐스트)
         if "execution_logs" in result:
+            log_messages = []
             for log in result["execution_logs"]:
                 if log["type"] == "ai_request":
-                    await broadcast_message({
+                    log_messages.append({
                         "type": "ai_request",
                         "nodeId": node.id,
                         "message": log["message"]
                     })
-                    await broadcast_message({
+                    log_messages.append({
                         "type": "progress",
                         "nodeId": node.id,
                         "progress": 0.5,
                         "message": "AI is processing your request"
                     })
                 elif log["type"] == "ai_response":
-                    await broadcast_message({
+                    log_messages.append({
                         "type": "ai_response",
                         "nodeId": node.id,
                         "message": log["message"]
                     })
                 elif log["type"] == "ai_complete":
-                    await broadcast_message({
+                    log_messages.append({
                         "type": "ai_complete",
                         "nodeId": node.id,
                         "message": "AI processing completed"
                     })
-                    await broadcast_message({
+                    log_messages.append({
                         "type": "progress",
                         "nodeId": node.id,
                         "progress": 0.7,
                         "message": "Processing AI response"
                     })
                 elif log["type"] == "error":
-                    await broadcast_message({
+                    log_messages.append({
                         "type": "ai_error",
                         "nodeId": node.id,
                         "error": log["message"]
                     })
+            if log_messages:
+                await broadcast_messages(log_messages)
         
         # Handle execution result
         if result["success"]:
@@ -748,52 +837,35 @@ async def execute_node_task(request: ExecuteRequest, node: Node, section: Sectio
             print(f"[OneAI] Sending output update for node: {node.id}")
             print(f"[OneAI] Output preview: {str(result['output'])[:100]}...")
             
-            await broadcast_message({
-                "type": "node_output_updated",
-                "nodeId": node.id,
-                "output": result["output"]
-            })
-            
-            # Complete progress
-            await broadcast_message({
-                "type": "progress",
-                "nodeId": node.id,
-                "progress": 1.0,
-                "message": "Complete"
-            })
-            
-            # Send various completion messages for compatibility
-            await broadcast_message({
-                "type": "ai_complete",
-                "nodeId": node.id,
-                "output": result["output"]
-            })
-            
-            await broadcast_message({
-                "type": "node_execution_complete",
-                "nodeId": node.id
-            })
-            
-            await broadcast_message({
-                "type": "execution_complete",
-                "nodeId": node.id
-            })
-            
-            await broadcast_message({
-                "type": "complete",
-                "nodeId": node.id
-            })
-            
-            await broadcast_message({
-                "type": "done",
-                "nodeId": node.id
-            })
-            
-            await broadcast_message({
-                "type": "output",
-                "nodeId": node.id,
-                "output": result["output"]
-            })
+            await broadcast_messages([
+                {
+                    "type": "node_output_updated",
+                    "nodeId": node.id,
+                    "output": result["output"]
+                },
+                # Complete progress
+                {
+                    "type": "progress",
+                    "nodeId": node.id,
+                    "progress": 1.0,
+                    "message": "Complete"
+                },
+                # Send various completion messages for compatibility
+                {
+                    "type": "ai_complete",
+                    "nodeId": node.id,
+                    "output": result["output"]
+                },
+                {"type": "node_execution_complete", "nodeId": node.id},
+                {"type": "execution_complete", "nodeId": node.id},
+                {"type": "complete", "nodeId": node.id},
+                {"type": "done", "nodeId": node.id},
+                {
+                    "type": "output",
+                    "nodeId": node.id,
+                    "output": result["output"]
+                }
+            ])
             
             print(f"[OneAI] Successfully completed execution for node: {node.id}")
             
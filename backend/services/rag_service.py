@@ -1,7 +1,8 @@
 # backend/services/rag_service.py
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
+from collections import defaultdict
 import uuid
 import numpy as np
 from pydantic import BaseModel
@@ -113,23 +114,19 @@ class RAGService:
     
     async def get_module_context(self, module: str, limit: int = 10) -> Dict[str, Any]:
         """특정 모듈의 최신 컨텍스트 가져오기"""
-        module_docs = []
+        # 존재하는 문서만 걸러내면서 바로 타입별로 그룹화 (중간 리스트 없이 한 번에)
+        context_by_type = defaultdict(list)
         for doc_id in self.module_indices.get(module, [])[-limit:]:
-            if doc_id in self.documents:
-                module_docs.append(self.documents[doc_id])
-        
-        # Group by type
-        context_by_type = {}
-        for doc in module_docs:
-            if doc.type not in context_by_type:
-                context_by_type[doc.type] = []
+            doc = self.documents.get(doc_id)
+            if doc is None:
+                continue
             context_by_type[doc.type].append({
                 "content": doc.content[:200] + "...",  # Summary
                 "metadata": doc.metadata,
                 "created_at": doc.created_at
             })
         
-        return context_by_type
+        return dict(context_by_type)
     
     async def find_related_work(self, doc_id: str, cross_module: bool = True) -> List[Document]:
         """관련 작업 찾기"""
@@ -180,10 +177,8 @@ class RAGService:
         context_parts = []
         
         # Group by module
-        by_module = {}
+        by_module = defaultdict(list)
         for doc in documents:
-            if doc.module not in by_module:
-                by_module[doc.module] = []
             by_module[doc.module].append(doc)
         
         # Generate context for each module
@@ -200,13 +195,15 @@ class RAGService:
         """문서 간 참조 관계 업데이트"""
         # Find references based on content similarity
         threshold = 0.6
+        existing_refs = set(new_doc.references)
         
         for doc_id, doc in self.documents.items():
             if doc_id != new_doc.id and doc.embedding and new_doc.embedding:
                 similarity = self._cosine_similarity(new_doc.embedding, doc.embedding)
                 if similarity > threshold:
                     # Add cross-reference
-                    if doc_id not in new_doc.references:
+                    if doc_id not in existing_refs:
+                        existing_refs.add(doc_id)
                         new_doc.references.append(doc_id)
                     if new_doc.id not in doc.references:
                         doc.references.append(new_doc.id)
@@ -228,19 +225,20 @@ class RAGService:
     def _build_cross_references(self, documents: List[Document]) -> Dict[str, List[str]]:
         """문서들의 모듈 간 참조 관계 구축"""
         cross_refs = {}
+        seen_refs: Dict[str, Set[str]] = {}  # 모듈별 중복 체크용 (리스트 탐색 대신 set)
         
         for doc in documents:
-            if doc.module not in cross_refs:
-                cross_refs[doc.module] = []
+            module_refs = cross_refs.setdefault(doc.module, [])
+            seen = seen_refs.setdefault(doc.module, set())
             
             # Check references to other modules
             for ref_id in doc.references:
-                if ref_id in self.documents:
-                    ref_doc = self.documents[ref_id]
-                    if ref_doc.module != doc.module:
-                        ref_info = f"{ref_doc.module}:{ref_doc.type}"
-                        if ref_info not in cross_refs[doc.module]:
-                            cross_refs[doc.module].append(ref_info)
+                ref_doc = self.documents.get(ref_id)
+                if ref_doc and ref_doc.module != doc.module:
+                    ref_info = f"{ref_doc.module}:{ref_doc.type}"
+                    if ref_info not in seen:
+                        seen.add(ref_info)
+                        module_refs.append(ref_info)
         
         return cross_refs
 
@@ -356,19 +354,17 @@ class ModuleIntegration:
         rag_result = await self.rag.search(rag_query)
         
         # Organize by module
-        context_by_module = {}
-        for doc in rag_result.documents:
-            if doc.module not in context_by_module:
-                context_by_module[doc.module] = []
+        context_by_module = defaultdict(list)
+        for doc, relevance in zip(rag_result.documents, rag_result.relevance_scores):
             context_by_module[doc.module].append({
                 "type": doc.type,
                 "summary": doc.content[:100] + "...",
-                "relevance": rag_result.relevance_scores[rag_result.documents.index(doc)]
+                "relevance": relevance
             })
         
         return {
             "full_context": rag_result.context,
-            "module_contexts": context_by_module,
+            "module_contexts": dict(context_by_module),
             "total_references": len(rag_result.documents),
             "cross_module_connections": rag_result.cross_references
         }
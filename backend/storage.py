@@ -2,11 +2,21 @@
 
 import os
 import json
+import mmap
 import hashlib
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from models import Section
 
+# orjson이 있으면 노드 데이터 로딩에 사용, 없으면 표준 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 이 크기를 넘는 파일만 mmap으로 읽음 (작은 파일은 일반 read가 더 빠름)
+MMAP_THRESHOLD = 64 * 1024
+
 # Global state storage - main.py와 공유
 sections_db: Dict[str, Section] = {}
 
@@ -33,8 +43,8 @@ def save_node_data(node_id: str, data: Dict[str, Any]):
         "timestamp": version_id,
         "data": data,
         "metadata": {
-            "inputHash": hashlib.md5(json.dumps(data.get("inputs", {})).encode()).hexdigest(),
-            "outputHash": hashlib.md5(json.dumps(data.get("output", {})).encode()).hexdigest(),
+            "inputHash": hashlib.blake2b(json.dumps(data.get("inputs", {})).encode(), digest_size=8).hexdigest(),
+            "outputHash": hashlib.blake2b(json.dumps(data.get("output", {})).encode(), digest_size=8).hexdigest(),
             "parameters": data.get("parameters", {}),
             "modelVersion": data.get("model", "none"),
             "modifiedBy": data.get("modifiedBy", "system")
@@ -44,11 +54,26 @@ def save_node_data(node_id: str, data: Dict[str, Any]):
     with open(f"{node_dir}/version_{version_id.replace(':', '-')}.json", "w") as f:
         json.dump(version_data, f, indent=2)
 
+def _load_json_file(path: str) -> Any:
+    """Load a JSON file (large files are mmapped and parsed without a str copy)"""
+    if orjson is None:
+        with open(path, "r") as f:
+            return json.load(f)
+    
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            mm.close()
+
 def load_node_data(node_id: str) -> Optional[Dict[str, Any]]:
     """Load node data from file system"""
     try:
-        with open(f"node-storage/{node_id}/data.json", "r") as f:
-            return json.load(f)
+        return _load_json_file(f"node-storage/{node_id}/data.json")
     except:
         return None
 
@@ -60,8 +85,7 @@ def get_node_versions(node_id: str, limit: int = 5) -> List[Dict[str, Any]]:
     if os.path.exists(node_dir):
         version_files = [f for f in os.listdir(node_dir) if f.startswith("version_")]
         for file in sorted(version_files, reverse=True)[:limit]:
-            with open(f"{node_dir}/{file}", "r") as f:
-                versions.append(json.load(f))
+            versions.append(_load_json_file(f"{node_dir}/{file}"))
     
     return versions
 
@@ -0,0 +1,28 @@
+# backend/tests/conftest.py - 테스트 공용 설정
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# main.py와 같이 backend 디렉토리를 기준으로 import (from ws_utils import ...)
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+@pytest.fixture
+def load_backend_module():
+    """backend 기준 상대 경로의 모듈을 패키지 __init__ 없이 단독으로 로드
+
+    routers.argosa 패키지는 import 시 fastapi 등 서버 의존성을 모두 불러오므로,
+    표준 라이브러리만 쓰는 헬퍼 모듈은 파일 경로로 직접 로드해 테스트한다.
+    """
+    def _load(relative_path: str, name: str):
+        spec = importlib.util.spec_from_file_location(name, BACKEND_DIR / relative_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    return _load
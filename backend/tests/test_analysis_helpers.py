@@ -0,0 +1,39 @@
+# backend/tests/test_analysis_helpers.py - analysis 헬퍼(ID 생성) 테스트
+
+import time
+
+import pytest
+
+
+@pytest.fixture
+def helpers(load_backend_module):
+    return load_backend_module("routers/argosa/analysis/helpers.py", "analysis_helpers")
+
+
+def test_generate_id_timestamp_round_trip(helpers):
+    before = time.time()
+    id_str = helpers.generate_id("workflow")
+    after = time.time()
+
+    assert id_str.startswith("workflow_")
+    assert before <= helpers.get_id_timestamp(id_str) <= after
+
+
+def test_generate_id_round_trip_with_underscored_prefix(helpers):
+    # code_analysis는 세션 ID(예: collab_..._...)를 다시 접두사로 사용
+    session_id = helpers.generate_id("collab")
+    ws_id = helpers.generate_id(session_id)
+
+    assert ws_id.startswith(session_id + "_")
+    assert helpers.get_id_timestamp(ws_id) >= helpers.get_id_timestamp(session_id)
+
+
+def test_generate_id_unique_when_called_back_to_back(helpers):
+    ids = [helpers.generate_id("task") for _ in range(1000)]
+
+    assert len(set(ids)) == len(ids)
+
+
+@pytest.mark.parametrize("id_str", ["", "workflow", "workflow_notanumber_1", "legacy-id"])
+def test_get_id_timestamp_rejects_foreign_ids(helpers, id_str):
+    assert helpers.get_id_timestamp(id_str) is None
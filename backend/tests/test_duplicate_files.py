@@ -0,0 +1,103 @@
+# backend/tests/test_duplicate_files.py - 코드 분석 중복 파일 그룹화 테스트
+
+import ast
+import hashlib
+import types
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+CODE_ANALYSIS_PATH = BACKEND_DIR / "routers/argosa/code_analysis.py"
+
+
+@pytest.fixture
+def analysis():
+    """code_analysis는 서버 의존성을 import하므로 _fast_hash와 _group_duplicate_files만 꺼내 실행"""
+    tree = ast.parse(CODE_ANALYSIS_PATH.read_text(encoding="utf-8"))
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "_fast_hash":
+            body.append(node)
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef) and item.name == "_group_duplicate_files":
+                    # 정적 메서드를 모듈 함수로 실행
+                    item.decorator_list = []
+                    body.append(item)
+    module = types.ModuleType("code_analysis_under_test")
+    module.__dict__.update(
+        hashlib=hashlib,
+        defaultdict=defaultdict,
+        xxhash=None,
+        Any=Any,
+        Dict=Dict,
+        List=List,
+        Optional=Optional,
+        Tuple=Tuple,
+    )
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(CODE_ANALYSIS_PATH), "exec"), module.__dict__)
+    return module
+
+
+def _entry(path, content, fingerprint=None):
+    return (path, len(content.encode()), content, fingerprint, content.count("\n") + 1)
+
+
+def _groups(duplicates):
+    return sorted(sorted(group["files"]) for group in duplicates)
+
+
+def test_groups_identical_files_only(analysis):
+    entries = [
+        _entry("a.py", "x = 1\ny = 2"),
+        _entry("b.py", "x = 1\ny = 2"),
+        _entry("c.py", "x = 1\ny = 3"),  # 같은 크기, 다른 내용
+        _entry("d.py", "print('unique')"),
+        _entry("e.py", ""),
+        _entry("f.py", ""),  # 빈 파일은 중복으로 보지 않음
+    ]
+
+    duplicates, fingerprints = analysis._group_duplicate_files(entries)
+
+    assert _groups(duplicates) == [["a.py", "b.py"]]
+    group = duplicates[0]
+    assert group["hash"] == hashlib.blake2b(b"x = 1\ny = 2").hexdigest()
+    assert group["lines"] == 2
+    # 크기가 같은 후보만 고속 해시를 계산
+    assert set(fingerprints) == {"a.py", "b.py", "c.py"}
+    assert fingerprints["a.py"] == fingerprints["b.py"] == analysis._fast_hash(b"x = 1\ny = 2")
+
+
+def test_reuses_cached_fingerprints(analysis, monkeypatch):
+    content = "def f():\n    return 1\n"
+    fingerprint = analysis._fast_hash(content.encode())
+    hashed = []
+    real_fast_hash = analysis._fast_hash
+    monkeypatch.setattr(analysis, "_fast_hash", lambda data: hashed.append(data) or real_fast_hash(data))
+
+    duplicates, fingerprints = analysis._group_duplicate_files([
+        _entry("a.py", content, fingerprint),
+        _entry("b.py", content),
+    ])
+
+    assert _groups(duplicates) == [["a.py", "b.py"]]
+    assert fingerprints == {"b.py": fingerprint}
+    assert hashed == [content.encode()]
+
+
+def test_fast_hash_collision_is_confirmed_with_blake2b(analysis, monkeypatch):
+    # 모든 파일이 같은 버킷에 들어가도 내용이 같은 파일끼리만 묶여야 함
+    monkeypatch.setattr(analysis, "_fast_hash", lambda data: 0)
+
+    duplicates, _ = analysis._group_duplicate_files([
+        _entry("a.py", "aaaa"),
+        _entry("b.py", "bbbb"),
+        _entry("c.py", "aaaa"),
+        _entry("d.py", "bbbb"),
+        _entry("e.py", "cccc"),
+    ])
+
+    assert _groups(duplicates) == [["a.py", "c.py"], ["b.py", "d.py"]]
@@ -0,0 +1,226 @@
+# backend/tests/test_execution_pool.py - 미리 띄운 인터프리터 풀/프로세스 종료 테스트
+
+import ast
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import subprocess
+import sys
+import types
+from typing import List, Optional
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+EXECUTION_PATH = BACKEND_DIR / "execution.py"
+
+# execution.py는 requests/models 등을 import하므로 필요한 정의만 소스에서 꺼내 실행
+DEFINITIONS = {"_PREWARM_BOOTSTRAP", "PREWARM_POOL_SIZE", "PrewarmedInterpreterPool", "_terminate_process_group"}
+
+# stdin이 닫힐 때까지 대기하는 가벼운 인터프리터 (부트스트랩 대신 사용)
+IDLE_SCRIPT = "import sys; sys.stdin.read()"
+
+
+def _defined_name(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node.name
+    if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    return None
+
+
+@pytest.fixture
+def execution():
+    tree = ast.parse(EXECUTION_PATH.read_text(encoding="utf-8"))
+    body = [node for node in tree.body if _defined_name(node) in DEFINITIONS]
+    namespace = {
+        "asyncio": asyncio,
+        "contextlib": contextlib,
+        "os": os,
+        "signal": signal,
+        "sys": sys,
+        "List": List,
+        "Optional": Optional,
+    }
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(EXECUTION_PATH), "exec"), namespace)
+    return types.SimpleNamespace(**namespace)
+
+
+def _idle_pool(execution, size):
+    pool = execution.PrewarmedInterpreterPool(size=size)
+    spawned = []
+
+    async def spawn(cwd):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", IDLE_SCRIPT,
+            stdin=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=True
+        )
+        spawned.append(process)
+        return process
+
+    pool._spawn = spawn
+    return pool, spawned
+
+
+def test_acquire_spawns_when_empty_and_refills_in_background(execution, tmp_path):
+    pool, spawned = _idle_pool(execution, size=2)
+
+    async def run():
+        process = await pool.acquire(str(tmp_path))
+        await pool._refill_task
+        idle = list(pool._idle)
+        await pool.shutdown()
+        process.kill()
+        await process.wait()
+        return process, idle
+
+    process, idle = asyncio.run(run())
+
+    assert spawned[0] is process
+    assert len(idle) == 2 and process not in idle
+    assert all(p.returncode is not None for p in spawned)
+
+
+def test_acquire_reuses_idle_and_skips_exited(execution, tmp_path):
+    pool, spawned = _idle_pool(execution, size=2)
+
+    async def run():
+        await pool._refill(str(tmp_path))
+        alive, dead = pool._idle
+        # 마지막(먼저 꺼낼) 인터프리터가 이미 종료된 경우
+        pool._idle = [alive, dead]
+        dead.kill()
+        await dead.wait()
+
+        process = await pool.acquire(str(tmp_path))
+        await pool._refill_task
+        await pool.shutdown()
+        process.kill()
+        await process.wait()
+        return alive, process
+
+    alive, process = asyncio.run(run())
+
+    assert process is alive
+    # 초기 2개 + 꺼낸 뒤 부족해진 2개 보충
+    assert len(spawned) == 4
+
+
+def test_shutdown_cancels_refill_and_kills_idle(execution, tmp_path):
+    pool, spawned = _idle_pool(execution, size=1)
+
+    async def run():
+        await pool._refill(str(tmp_path))
+        idle = list(pool._idle)
+        pool._refill_task = asyncio.create_task(asyncio.Event().wait())
+        await pool.shutdown()
+        with contextlib.suppress(asyncio.CancelledError):
+            await pool._refill_task
+        return idle
+
+    idle = asyncio.run(run())
+
+    assert pool._idle == []
+    assert pool._refill_task.cancelled()
+    assert all(p.returncode is not None for p in idle)
+
+
+def test_bootstrap_runs_script_like_python_script(execution, tmp_path):
+    # 부트스트랩은 실행 프로세스의 공통 의존성(requests)을 미리 import함
+    pytest.importorskip("requests")
+    script_dir = tmp_path / "run"
+    script_dir.mkdir()
+    (script_dir / "sibling.py").write_text("VALUE = 'sibling'\n")
+    script = script_dir / "node_code.py"
+    script.write_text(
+        "import json, os, sys\n"
+        "import sibling\n"
+        "print(json.dumps({'path0': sys.path[0], 'has_cwd': '' in sys.path,\n"
+        "                  'argv': sys.argv, 'sibling': sibling.VALUE,\n"
+        "                  'env': os.environ.get('NODE_ENV_MARKER')}))\n"
+    )
+    request = {"script": str(script), "env": {**os.environ, "NODE_ENV_MARKER": "fresh"}}
+
+    completed = subprocess.run(
+        [sys.executable, "-c", execution._PREWARM_BOOTSTRAP],
+        input=json.dumps(request) + "\n",
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        timeout=30
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    result = json.loads(completed.stdout)
+    assert result == {
+        "path0": str(script_dir),
+        "has_cwd": False,
+        "argv": [str(script)],
+        "sibling": "sibling",
+        "env": "fresh",
+    }
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("ignore_sigterm", [False, True])
+def test_terminate_process_group_kills_grandchildren(execution, ignore_sigterm):
+    # 사용자 코드가 띄운 자식 프로세스(손자)가 준비되면 그 PID를 출력하고 대기
+    # ignore_sigterm이면 SIGTERM을 무시해 유예 시간 뒤 SIGKILL 경로를 탄다
+    child_script = (
+        "import signal, time\n"
+        f"if {ignore_sigterm}:\n"
+        "    signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        "print('ready', flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    script = (
+        "import signal, subprocess, sys, time\n"
+        f"if {ignore_sigterm}:\n"
+        "    signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        f"child = subprocess.Popen([sys.executable, '-c', {child_script!r}], stdout=subprocess.PIPE)\n"
+        "child.stdout.readline()\n"
+        "print(child.pid, flush=True)\n"
+        "time.sleep(60)\n"
+    )
+
+    async def run():
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", script,
+            stdout=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+        grandchild_pid = int(await process.stdout.readline())
+        await execution._terminate_process_group(process, grace=0.5)
+        # 손자 프로세스는 init이 회수할 때까지 잠시 걸릴 수 있음
+        for _ in range(50):
+            if not _pid_alive(grandchild_pid):
+                break
+            await asyncio.sleep(0.05)
+        return process, grandchild_pid
+
+    process, grandchild_pid = asyncio.run(run())
+
+    assert process.returncode == (-signal.SIGKILL if ignore_sigterm else -signal.SIGTERM)
+    assert not _pid_alive(grandchild_pid)
+
+
+def test_terminate_process_group_ignores_exited_process(execution):
+    async def run():
+        process = await asyncio.create_subprocess_exec(sys.executable, "-c", "pass")
+        await process.wait()
+        await execution._terminate_process_group(process)
+        return process
+
+    assert asyncio.run(run()).returncode == 0
@@ -0,0 +1,126 @@
+# backend/tests/test_llm_conversation_stats.py - 대화 수집기 파일별 통계 캐시 테스트
+
+import ast
+import asyncio
+import json
+import logging
+import os
+import types
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+COLLECTOR_PATH = BACKEND_DIR / "routers/argosa/collection/llm_conversation_collector.py"
+
+# 수집기 모듈은 fastapi/pydantic을 import하므로 통계 관련 정의만 소스에서 꺼내 실행
+MODULE_NAMES = {"LLM_DATA_PATH", "SUPPORTED_PLATFORMS", "_read_json"}
+COLLECTOR_METHODS = {"__init__", "_ensure_directories", "get_platform_stats", "clean_old_data"}
+
+
+def _defined_name(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node.name
+    if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    return None
+
+
+@pytest.fixture
+def collector_module(tmp_path):
+    tree = ast.parse(COLLECTOR_PATH.read_text(encoding="utf-8"))
+    body = [node for node in tree.body if _defined_name(node) in MODULE_NAMES]
+    collector = next(node for node in tree.body if _defined_name(node) == "LLMConversationCollector")
+    collector.body = [node for node in collector.body if _defined_name(node) in COLLECTOR_METHODS]
+    body.append(collector)
+
+    module = types.ModuleType("llm_conversation_collector_under_test")
+    module.__dict__.update(
+        json=json,
+        os=os,
+        logger=logging.getLogger("llm_conversation_collector_under_test"),
+        orjson=None,
+        datetime=datetime,
+        timedelta=timedelta,
+        Path=Path,
+        CollectionStats=types.SimpleNamespace,
+        Any=Any,
+        Dict=Dict,
+        List=List,
+        Optional=Optional,
+        Tuple=Tuple,
+    )
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(COLLECTOR_PATH), "exec"), module.__dict__)
+    module.LLM_DATA_PATH = tmp_path / "llm-conversations"
+    return module
+
+
+@pytest.fixture
+def parsed(collector_module, monkeypatch):
+    """_read_json으로 실제 파싱한 파일 이름 기록"""
+    calls = []
+    real_read_json = collector_module._read_json
+
+    def read_json(path):
+        calls.append(path.name)
+        return real_read_json(path)
+
+    monkeypatch.setattr(collector_module, "_read_json", read_json)
+    return calls
+
+
+def _write_conversations(path, count, excluded=0):
+    path.write_text(json.dumps({
+        "conversations": [{"id": str(i)} for i in range(count)],
+        "metadata": {"excluded_llm_count": excluded},
+    }))
+
+
+def test_unchanged_files_are_not_reparsed(collector_module, parsed):
+    collector = collector_module.LLMConversationCollector()
+    platform_dir = collector_module.LLM_DATA_PATH / "chatgpt"
+    _write_conversations(platform_dir / "2024-01-01_conversations_1.json", 2)
+    _write_conversations(platform_dir / "2024-01-02_conversations_1.json", 3, excluded=1)
+    (platform_dir / "notes.txt").write_text("ignored")
+
+    first = asyncio.run(collector.get_platform_stats("chatgpt"))["chatgpt"]
+    second = asyncio.run(collector.get_platform_stats("chatgpt"))["chatgpt"]
+
+    assert first == second
+    assert first.total_conversations == 5
+    assert first.file_count == 2
+    assert sorted(parsed) == ["2024-01-01_conversations_1.json", "2024-01-02_conversations_1.json"]
+
+
+def test_changed_file_is_reparsed(collector_module, parsed):
+    collector = collector_module.LLMConversationCollector()
+    path = collector_module.LLM_DATA_PATH / "claude" / "2024-01-01_conversations_1.json"
+    _write_conversations(path, 1)
+    asyncio.run(collector.get_platform_stats("claude"))
+
+    # 내용 크기가 바뀌면 (mtime, size) 서명이 달라져 다시 파싱
+    _write_conversations(path, 4)
+    stats = asyncio.run(collector.get_platform_stats("claude"))["claude"]
+
+    assert stats.total_conversations == 4
+    assert parsed == [path.name, path.name]
+
+
+def test_clean_old_data_drops_cached_stats(collector_module):
+    collector = collector_module.LLMConversationCollector()
+    platform_dir = collector_module.LLM_DATA_PATH / "gemini"
+    old_file = platform_dir / "2000-01-01_conversations_1.json"
+    new_file = platform_dir / f"{datetime.now():%Y-%m-%d}_conversations_1.json"
+    _write_conversations(old_file, 1)
+    _write_conversations(new_file, 2)
+    asyncio.run(collector.get_platform_stats("gemini"))
+    assert str(old_file) in collector._file_stats_cache
+
+    deleted = asyncio.run(collector.clean_old_data(days_to_keep=30))
+
+    assert deleted["gemini"] == 1
+    assert str(old_file) not in collector._file_stats_cache
+    assert str(new_file) in collector._file_stats_cache
@@ -0,0 +1,87 @@
+# backend/tests/test_llm_tracker.py - LLM 추적 저널 재생/압축 테스트
+
+import asyncio
+import json
+
+import pytest
+
+
+@pytest.fixture
+def tracker_module(load_backend_module, tmp_path, monkeypatch):
+    # 추적 파일은 작업 디렉토리 기준 ./data/argosa 아래에 저장됨
+    monkeypatch.chdir(tmp_path)
+    return load_backend_module("routers/argosa/shared/llm_tracker.py", "llm_tracker_under_test")
+
+
+async def _track_all(tracker, conversation_ids, platform="chatgpt"):
+    for conversation_id in conversation_ids:
+        await tracker.track(conversation_id, platform)
+    await tracker._journal_task
+
+
+def test_journal_replay_restores_tracked_conversations(tracker_module):
+    tracker = tracker_module.LLMTracker()
+    asyncio.run(_track_all(tracker, ["a", "b", "c"]))
+
+    assert tracker._journal_file.exists()
+    assert not tracker._persistence_file.exists()
+
+    reloaded = tracker_module.LLMTracker()
+
+    assert reloaded._tracked_ids == {"a", "b", "c"}
+    assert reloaded._platform_stats == {"chatgpt": 3}
+    assert reloaded._metadata["a"]["platform"] == "chatgpt"
+    assert reloaded._journal_lines == 3
+
+
+def test_journal_replay_skips_truncated_last_line(tracker_module):
+    tracker = tracker_module.LLMTracker()
+    asyncio.run(_track_all(tracker, ["a", "b"]))
+
+    # 쓰다 끊긴 마지막 줄 (프로세스 중단 등)
+    with open(tracker._journal_file, "a") as f:
+        f.write('{"id": "c", "metadata": {"platf')
+
+    reloaded = tracker_module.LLMTracker()
+
+    assert reloaded._tracked_ids == {"a", "b"}
+    assert reloaded._platform_stats == {"chatgpt": 2}
+    assert reloaded._journal_lines == 2
+
+
+def test_journal_replay_on_top_of_snapshot(tracker_module):
+    tracker = tracker_module.LLMTracker()
+    asyncio.run(_track_all(tracker, ["a"]))
+    asyncio.run(tracker._save_state())
+    assert not tracker._journal_file.exists()
+
+    asyncio.run(_track_all(tracker, ["a", "b"], platform="claude"))
+
+    reloaded = tracker_module.LLMTracker()
+
+    # 이미 스냅샷에 있는 ID는 다시 세지 않음
+    assert reloaded._tracked_ids == {"a", "b"}
+    assert reloaded._platform_stats == {"chatgpt": 1, "claude": 1}
+
+
+def test_journal_compacts_at_threshold(tracker_module, monkeypatch):
+    monkeypatch.setattr(tracker_module, "JOURNAL_COMPACT_THRESHOLD", 3)
+    tracker = tracker_module.LLMTracker()
+
+    asyncio.run(_track_all(tracker, ["a", "b"]))
+    assert tracker._journal_lines == 2
+    assert not tracker._persistence_file.exists()
+
+    asyncio.run(_track_all(tracker, ["c"]))
+
+    # 임계값에 도달하면 스냅샷으로 합치고 저널을 비움
+    assert tracker._journal_lines == 0
+    assert not tracker._journal_file.exists()
+    with open(tracker._persistence_file) as f:
+        snapshot = json.load(f)
+    assert set(snapshot["tracked_ids"]) == {"a", "b", "c"}
+    assert snapshot["platform_stats"] == {"chatgpt": 3}
+
+    reloaded = tracker_module.LLMTracker()
+    assert reloaded._tracked_ids == {"a", "b", "c"}
+    assert reloaded._journal_lines == 0
@@ -0,0 +1,165 @@
+# backend/tests/test_oneai_outbound.py - One AI 클라이언트별 송신 큐/느린 클라이언트 해제 테스트
+
+import ast
+import asyncio
+import types
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from conftest import BACKEND_DIR
+from ws_utils import decode_message, encode_message
+
+ONEAI_PATH = BACKEND_DIR / "routers/oneai.py"
+
+# routers/oneai.py는 fastapi/httpx 등을 import하므로 송신 큐 관련 정의만 소스에서 꺼내 실행
+DEFINITIONS = {
+    "active_connections", "connection_tasks", "OUTBOUND_QUEUE_SIZE", "outbound_queues",
+    "writer_tasks", "_client_snapshot", "_refresh_client_snapshot", "_cleanup_client",
+    "_writer_loop", "_enqueue", "send_to_client", "broadcast_message", "broadcast_messages",
+}
+
+
+def _defined_name(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return node.name
+    if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return node.target.id
+    return None
+
+
+@pytest.fixture
+def oneai():
+    tree = ast.parse(ONEAI_PATH.read_text(encoding="utf-8"))
+    body = [node for node in tree.body if _defined_name(node) in DEFINITIONS]
+    # 전역 상태(_client_snapshot 등)를 다시 바인딩하므로 모듈 객체에서 실행해 속성 조회가 항상 최신값을 보게 함
+    module = types.ModuleType("oneai_under_test")
+    module.__dict__.update(
+        asyncio=asyncio,
+        encode_message=encode_message,
+        WebSocket=object,
+        Dict=Dict,
+        List=List,
+        Optional=Optional,
+        Tuple=Tuple,
+    )
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(ONEAI_PATH), "exec"), module.__dict__)
+    return module
+
+
+class FakeWebSocket:
+    def __init__(self, block=False, fail=False):
+        self.sent = []
+        self.closed_with = None
+        self.fail = fail
+        self.unblocked = asyncio.Event()
+        if not block:
+            self.unblocked.set()
+
+    async def send_text(self, payload):
+        await self.unblocked.wait()
+        if self.fail:
+            raise ConnectionError("closed")
+        self.sent.append(decode_message(payload))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def _connect(oneai, client_id, websocket):
+    # websocket_endpoint가 연결 시 등록하는 것과 같은 상태
+    queue = asyncio.Queue(maxsize=oneai.OUTBOUND_QUEUE_SIZE)
+    oneai.active_connections[client_id] = websocket
+    oneai.outbound_queues[client_id] = queue
+    oneai._refresh_client_snapshot()
+    oneai.writer_tasks[client_id] = asyncio.create_task(oneai._writer_loop(client_id, websocket, queue))
+    return queue
+
+
+async def _drain(oneai):
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_broadcast_messages_delivered_in_order(oneai):
+    async def run():
+        sockets = {client_id: FakeWebSocket() for client_id in ("a", "b")}
+        for client_id, ws in sockets.items():
+            _connect(oneai, client_id, ws)
+
+        await oneai.broadcast_messages([{"seq": 1}, {"seq": 2}])
+        await oneai.broadcast_message({"seq": 3})
+        assert oneai.send_to_client("a", encode_message({"seq": 4}))
+        assert not oneai.send_to_client("missing", encode_message({"seq": 5}))
+        await _drain(oneai)
+
+        for client_id in list(sockets):
+            oneai._cleanup_client(client_id)
+        return sockets
+
+    sockets = asyncio.run(run())
+
+    assert [m["seq"] for m in sockets["a"].sent] == [1, 2, 3, 4]
+    assert [m["seq"] for m in sockets["b"].sent] == [1, 2, 3]
+
+
+def test_slow_client_is_disconnected_with_1013(oneai):
+    oneai.OUTBOUND_QUEUE_SIZE = 2
+
+    async def run():
+        fast, slow = FakeWebSocket(), FakeWebSocket(block=True)
+        _connect(oneai, "fast", fast)
+        _connect(oneai, "slow", slow)
+        slow_writer = oneai.writer_tasks["slow"]
+
+        for seq in range(4):
+            await oneai.broadcast_message({"seq": seq})
+            await _drain(oneai)
+
+        await asyncio.sleep(0)
+        state = {
+            "connected": set(oneai.active_connections),
+            "snapshot": [client_id for client_id, _ in oneai._client_snapshot],
+            "slow_writer_done": slow_writer.done(),
+        }
+        oneai._cleanup_client("fast")
+        return fast, slow, state
+
+    fast, slow, state = asyncio.run(run())
+
+    assert [m["seq"] for m in fast.sent] == [0, 1, 2, 3]
+    assert slow.closed_with == 1013
+    assert fast.closed_with is None
+    assert state == {"connected": {"fast"}, "snapshot": ["fast"], "slow_writer_done": True}
+
+
+def test_writer_failure_cleans_up_only_its_own_connection(oneai):
+    async def run():
+        broken = FakeWebSocket(fail=True)
+        _connect(oneai, "c", broken)
+        old_queue = oneai.outbound_queues["c"]
+
+        # 같은 client_id로 재접속한 뒤 이전 연결의 writer가 실패하는 경우
+        oneai._cleanup_client("c")
+        replacement = FakeWebSocket()
+        _connect(oneai, "c", replacement)
+        old_queue.put_nowait(encode_message({"seq": 0}))
+        broken_writer = asyncio.create_task(oneai._writer_loop("c", broken, old_queue))
+        await broken_writer
+        still_registered = oneai.active_connections.get("c") is replacement
+
+        # 현재 연결의 writer가 실패하면 정리
+        replacement.fail = True
+        await oneai.broadcast_message({"seq": 1})
+        await _drain(oneai)
+        return still_registered
+
+    still_registered = asyncio.run(run())
+
+    assert still_registered
+    assert oneai.active_connections == {}
+    assert oneai.outbound_queues == {}
+    assert oneai.writer_tasks == {}
+    assert oneai._client_snapshot == ()
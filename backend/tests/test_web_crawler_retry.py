@@ -0,0 +1,146 @@
+# backend/tests/test_web_crawler_retry.py - 웹 크롤러 재시도/동시 요청 제한 테스트
+
+import ast
+import asyncio
+import logging
+import random
+import types
+from typing import Any, Dict, Optional
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+CRAWLER_PATH = BACKEND_DIR / "routers/argosa/collection/web_crawler_agent.py"
+
+# web_crawler_agent는 aiohttp/bs4/langgraph 등을 import하므로
+# 재시도 로직에 필요한 정의만 소스에서 꺼내 단독으로 실행한다
+MODULE_NAMES = {"MAX_RETRIES", "BACKOFF_MAX_TIME", "RETRYABLE_STATUS_CODES", "_retry_hint", "_retry_delay"}
+ENGINE_METHODS = {"_with_retry", "_get_native_command_manager", "_native_request", "_crawl_with_native"}
+
+
+def _defined_name(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node.name
+    if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    return None
+
+
+@pytest.fixture
+def crawler():
+    tree = ast.parse(CRAWLER_PATH.read_text(encoding="utf-8"))
+    body = [node for node in tree.body if _defined_name(node) in MODULE_NAMES]
+    engine = next(node for node in tree.body if _defined_name(node) == "WebCrawlerEngine")
+    engine.body = [node for node in engine.body if _defined_name(node) in ENGINE_METHODS]
+    body.append(engine)
+
+    namespace = {
+        "asyncio": asyncio,
+        "random": random,
+        "logger": logging.getLogger("web_crawler_under_test"),
+        "Dict": Dict,
+        "Any": Any,
+        "Optional": Optional,
+        "aiohttp": types.SimpleNamespace(ClientError=ConnectionError),
+    }
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(CRAWLER_PATH), "exec"), namespace)
+    return types.SimpleNamespace(**namespace)
+
+
+class FakeNativeCommandManager:
+    """미리 정한 응답을 순서대로 돌려주는 Native 명령 관리자"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.commands = []
+
+    async def send_command(self, command, params):
+        self.commands.append(command)
+        return f"cmd_{len(self.commands)}"
+
+    async def wait_for_response(self, command_id, timeout=30):
+        return self.responses.pop(0)
+
+
+def _make_engine(crawler, responses, max_concurrent=1):
+    engine = crawler.WebCrawlerEngine.__new__(crawler.WebCrawlerEngine)
+    engine._native_command_manager = FakeNativeCommandManager(responses)
+    engine._request_semaphore = asyncio.Semaphore(max_concurrent)
+    return engine
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def test_rate_limited_crawl_is_retried(crawler, sleeps):
+    engine = _make_engine(crawler, [
+        {"error": "Too Many Requests", "status_code": 429, "retry_after": "2"},
+        {"content": "ok", "extracted_data": {}},
+    ])
+    analysed_with_free_slot = []
+
+    async def process_with_llm(content, content_type, source=""):
+        # LLM 분석 중에는 요청 슬롯을 잡고 있지 않아야 함
+        analysed_with_free_slot.append(not engine._request_semaphore.locked())
+        return {"summary": "analysed"}
+
+    engine._process_with_llm = process_with_llm
+
+    result = asyncio.run(engine._with_retry(engine._crawl_with_native, "https://example.com", "q"))
+
+    assert result["status"] == "success"
+    assert result["analysis"] == {"summary": "analysed"}
+    assert engine._native_command_manager.commands == ["crawl_web", "crawl_web"]
+    # Retry-After 값을 그대로 사용
+    assert sleeps == [2.0]
+    assert analysed_with_free_slot == [True]
+
+
+def test_non_retryable_error_is_returned_immediately(crawler, sleeps):
+    calls = []
+
+    async def search():
+        calls.append(1)
+        return {"status": "error", "error": "Google API not configured", "results": []}
+
+    engine = _make_engine(crawler, [])
+    result = asyncio.run(engine._with_retry(search))
+
+    assert result["error"] == "Google API not configured"
+    assert calls == [1]
+    assert sleeps == []
+
+
+def test_retry_gives_up_after_max_retries(crawler, sleeps):
+    calls = []
+
+    async def search():
+        calls.append(1)
+        return {"status": "error", "error": "Service Unavailable", "status_code": 503}
+
+    engine = _make_engine(crawler, [])
+    result = asyncio.run(engine._with_retry(search))
+
+    assert result["status_code"] == 503
+    assert len(calls) == crawler.MAX_RETRIES
+    assert len(sleeps) == crawler.MAX_RETRIES - 1
+    assert all(0 < delay <= crawler.BACKOFF_MAX_TIME for delay in sleeps)
+
+
+def test_transient_exceptions_are_marked_retryable(crawler):
+    timeout = type("HTTPException", (Exception,), {"status_code": 408})()
+
+    assert crawler._retry_hint(timeout) == {"status_code": 408}
+    assert crawler._retry_hint(asyncio.TimeoutError()) == {"retryable": True}
+    assert crawler._retry_hint(ValueError("bad")) == {}
+    assert crawler._retry_delay({"status": "error", "retryable": True}, 0) is not None
+    assert crawler._retry_delay({"status": "success", "status_code": 429}, 0) is None
@@ -0,0 +1,123 @@
+# backend/tests/test_ws_utils.py - WebSocket 공용 유틸리티 테스트
+
+import asyncio
+
+import ws_utils
+
+
+class FakeWebSocket:
+    """send_text 호출을 기록하는 가짜 웹소켓 (fail=True면 전송 실패)"""
+
+    def __init__(self, tracker=None, fail=False):
+        self.tracker = tracker
+        self.fail = fail
+        self.sent = []
+        self.tasks = []
+
+    async def send_text(self, payload):
+        self.tasks.append(asyncio.current_task())
+        if self.tracker is not None:
+            self.tracker.enter()
+        try:
+            await asyncio.sleep(0)
+            if self.fail:
+                raise ConnectionError("closed")
+            self.sent.append(payload)
+        finally:
+            if self.tracker is not None:
+                self.tracker.exit()
+
+
+class ConcurrencyTracker:
+    """동시에 진행 중인 send_text 수의 최댓값 기록"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    def enter(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+    def exit(self):
+        self.active -= 1
+
+
+def test_broadcast_text_collects_failures():
+    sockets = {f"c{i}": FakeWebSocket(fail=i in (1, 3)) for i in range(5)}
+
+    failed = asyncio.run(ws_utils.broadcast_text(sockets.items(), "payload"))
+
+    assert sorted(key for key, _ in failed) == ["c1", "c3"]
+    assert all(isinstance(error, ConnectionError) for _, error in failed)
+    for key, ws in sockets.items():
+        assert ws.sent == ([] if key in ("c1", "c3") else ["payload"])
+
+
+def test_broadcast_text_respects_batch_size(monkeypatch):
+    monkeypatch.setattr(ws_utils, "BROADCAST_BATCH_SIZE", 2)
+    tracker = ConcurrencyTracker()
+    # 배치 경계(2, 4)를 넘도록 5개, 마지막 배치는 1개
+    sockets = [(i, FakeWebSocket(tracker, fail=(i == 4))) for i in range(5)]
+
+    failed = asyncio.run(ws_utils.broadcast_text(sockets, "payload"))
+
+    assert tracker.peak == 2
+    assert [key for key, _ in failed] == [4]
+    assert [len(ws.sent) for _, ws in sockets] == [1, 1, 1, 1, 0]
+
+
+def test_broadcast_text_single_target_sends_inline():
+    ws = FakeWebSocket()
+
+    async def run():
+        failed = await ws_utils.broadcast_text([("only", ws)], "payload")
+        return failed, asyncio.current_task()
+
+    failed, caller_task = asyncio.run(run())
+
+    assert failed == []
+    assert ws.sent == ["payload"]
+    # 수신자가 하나면 별도 태스크를 만들지 않고 호출한 태스크에서 바로 전송
+    assert ws.tasks == [caller_task]
+
+
+def test_broadcast_text_single_target_failure():
+    failed = asyncio.run(ws_utils.broadcast_text([("only", FakeWebSocket(fail=True))], "payload"))
+
+    assert [key for key, _ in failed] == ["only"]
+
+
+def test_broadcast_text_no_targets():
+    assert asyncio.run(ws_utils.broadcast_text([], "payload")) == []
+
+
+def test_broadcast_text_cancels_pending_sends_when_cancelled():
+    class BlockingWebSocket:
+        def __init__(self):
+            self.cancelled = False
+
+        async def send_text(self, payload):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+    sockets = [(i, BlockingWebSocket()) for i in range(3)]
+
+    async def run():
+        broadcast = asyncio.create_task(ws_utils.broadcast_text(sockets, "payload"))
+        await asyncio.sleep(0.01)
+        broadcast.cancel()
+        try:
+            await broadcast
+        except asyncio.CancelledError:
+            pass
+        # broadcast_text가 끝난 뒤 남아 있는 태스크는 현재 태스크뿐이어야 함
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    leftover = asyncio.run(run())
+
+    assert leftover == set()
+    assert all(ws.cancelled for _, ws in sockets)
@@ -0,0 +1,94 @@
+# backend/ws_utils.py - WebSocket 공용 유틸리티
+
+from typing import Any, Iterable, List, Tuple, Union
+from datetime import datetime
+import asyncio
+import json
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_message(message: Any) -> str:
+    """브로드캐스트용 메시지를 한 번만 JSON 텍스트로 인코딩
+
+    Starlette의 send_json과 같은 형식(공백 없는 구분자, ensure_ascii=False)을 만들어
+    클라이언트마다 다시 직렬화하지 않고 send_text로 그대로 보낼 수 있게 한다.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def decode_message(raw: Union[str, bytes]) -> Any:
+    """수신한 WebSocket 텍스트 프레임을 JSON으로 디코딩 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# 한 번에 동시 전송할 최대 소켓 수 (배치 사이에는 이벤트 루프에 양보)
+BROADCAST_BATCH_SIZE = 128
+
+
+async def broadcast_text(
+    targets: Iterable[Tuple[Any, Any]], payload: str
+) -> List[Tuple[Any, BaseException]]:
+    """미리 인코딩된 payload를 (키, 웹소켓) 목록에 배치 단위로 동시 전송
+
+    느린 클라이언트 하나가 나머지 전송을 막지 않도록 배치 안에서는 동시에 보내고,
+    전송에 실패한 (키, 예외) 목록을 반환한다.
+    """
+    targets = list(targets)
+    if not targets:
+        return []
+    
+    failed = []
+    
+    async def _send(key: Any, ws: Any):
+        # 실패는 여기서 바로 모으므로 결과 리스트를 만들 필요가 없음
+        try:
+            await ws.send_text(payload)
+        except Exception as e:
+            failed.append((key, e))
+    
+    # 수신자가 하나뿐이면 태스크 생성 없이 바로 전송
+    if len(targets) == 1:
+        await _send(*targets[0])
+        return failed
+    
+    for start in range(0, len(targets), BROADCAST_BATCH_SIZE):
+        batch = targets[start:start + BROADCAST_BATCH_SIZE]
+        tasks = [asyncio.create_task(_send(key, ws)) for key, ws in batch]
+        try:
+            await asyncio.wait(tasks)
+        except asyncio.CancelledError:
+            # 호출한 쪽이 취소되면 (종료/정리 중) 전송 태스크가 고아로 남지 않도록 함께 취소
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        if start + BROADCAST_BATCH_SIZE < len(targets):
+            await asyncio.sleep(0)
+    return failed
+
+
+# 초 단위로 캐시한 타임스탬프 (메시지마다 datetime 생성/포맷 비용을 피함)
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def now_iso() -> str:
+    """WebSocket 메시지용 현재 시각 ISO 문자열 (초 단위, 같은 초 안에서는 캐시 재사용)"""
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_sec = sec
+        _last_ts_str = datetime.fromtimestamp(sec).isoformat()
+    return _last_ts_str